@@ -5,11 +5,29 @@ Contains fundamental components for the Claude Code hooks system:
 - shared_state: Cross-hook state management and communication
 - pattern_detector: Advanced pattern detection for optimization suggestions
 - context_enrichment: Intelligent context analysis and enhancement
+
+Submodules are imported lazily on first attribute access (PEP 562).
 """
 
-from .context import ContextAnalyzer, IntelligentReminder
-from .pattern_detector import PatternDetector, SmartSuggestions, WorkflowPattern
-from .shared_state import HookStateManager, PerformanceMonitor, SessionTracker
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .context import ContextAnalyzer, IntelligentReminder
+    from .pattern_detector import PatternDetector, SmartSuggestions, WorkflowPattern
+    from .shared_state import HookStateManager, PerformanceMonitor, SessionTracker
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "ContextAnalyzer": ".context",
+    "IntelligentReminder": ".context",
+    "PatternDetector": ".pattern_detector",
+    "SmartSuggestions": ".pattern_detector",
+    "WorkflowPattern": ".pattern_detector",
+    "HookStateManager": ".shared_state",
+    "PerformanceMonitor": ".shared_state",
+    "SessionTracker": ".shared_state",
+}
 
 __all__ = [
     "ContextAnalyzer",
@@ -21,3 +39,17 @@ __all__ = [
     "SmartSuggestions",
     "WorkflowPattern",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,23 +2,57 @@
 """
 Context-aware hooks for Claude Code
 Modular architecture with clean separation of concerns
+
+Submodules are imported lazily on first attribute access (PEP 562) so
+callers that only need one component don't pay for the others.
 """
 
-from typing import TYPE_CHECKING
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .analyzer import ContextAnalyzer
+    from .analyzer import AnalyzedContext, ContextAnalyzer
     from .reminders import IntelligentReminder
     from .tools import get_relevant_mcp_tools
-else:
+    from .trivial import is_trivial_prompt
+
+# Library modules stay silent unless the host application configures logging
+logging.getLogger("claude_hooks.context").addHandler(logging.NullHandler())
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "AnalyzedContext": "analyzer",
+    "ContextAnalyzer": "analyzer",
+    "IntelligentReminder": "reminders",
+    "get_relevant_mcp_tools": "tools",
+    "is_trivial_prompt": "trivial",
+}
+
+__all__ = [
+    "AnalyzedContext",
+    "ContextAnalyzer",
+    "IntelligentReminder",
+    "get_relevant_mcp_tools",
+    "is_trivial_prompt",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
     try:
-        from .analyzer import ContextAnalyzer
-        from .reminders import IntelligentReminder
-        from .tools import get_relevant_mcp_tools
+        module = importlib.import_module(f".{module_name}", __name__)
     except ImportError:
         # Fallback for direct execution
-        from analyzer import ContextAnalyzer  # type: ignore
-        from reminders import IntelligentReminder  # type: ignore
-        from tools import get_relevant_mcp_tools  # type: ignore
+        module = importlib.import_module(module_name)
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["ContextAnalyzer", "IntelligentReminder", "get_relevant_mcp_tools"]
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
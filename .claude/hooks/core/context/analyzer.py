@@ -6,38 +6,316 @@ Provides intelligent context analysis for user prompts and intent detection.
 Part of the Claude Code hooks system for enhanced context awareness.
 """
 
+import importlib
+import logging
 import re
-from functools import lru_cache
-from typing import TYPE_CHECKING, Any, ClassVar
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass, fields
+from functools import cached_property, wraps
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
-if TYPE_CHECKING:
-    from ..pattern_detector import PatternDetector
-    from ..shared_state import HookStateManager, SessionTracker
-else:
-    # Runtime imports with graceful fallbacks
-    PatternDetector = None
-    HookStateManager = None
-    SessionTracker = None
-
-    try:
-        # First try relative imports (when used as a package)
-        from ..pattern_detector import PatternDetector
-        from ..shared_state import HookStateManager, SessionTracker
-    except ImportError:
+from .trivial import is_trivial_prompt
+
+_log = logging.getLogger("claude_hooks.context")
+
+
+def _import_core_module(name: str) -> ModuleType:
+    """Import a sibling core module, relative to the package when possible."""
+    if __package__:
         try:
-            # Try absolute imports from parent directory
-            import os
-            import sys
-
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(current_dir)
-            if parent_dir not in sys.path:
-                sys.path.insert(0, parent_dir)
-            from pattern_detector import PatternDetector  # type: ignore
-            from shared_state import HookStateManager, SessionTracker  # type: ignore
+            return importlib.import_module(f"..{name}", __package__)
         except ImportError:
-            # Keep as None for graceful fallback
+            # Package root is context/ itself (e.g. via context_enrichment)
             pass
+    return importlib.import_module(name)
+
+
+if TYPE_CHECKING:
+    from ..pattern_detector import PatternDetector
+    from ..shared_state import HookStateManager, SessionTracker
+
+
+# Maps every ASCII character outside [A-Za-z0-9_] to a space so str.split()
+# yields the same tokens as \b\w+\b on ASCII input
+_ASCII_NON_WORD_TO_SPACE = str.maketrans(
+    {char: " " for char in map(chr, range(128)) if not (char.isalnum() or char == "_")}
+)
+
+# (suggested tools, suggested agents) as (name, reason) pairs
+_Suggestions = tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]
+
+# Prompts longer than this are never cached; they rarely repeat and would
+# only churn the cache
+_MAX_CACHED_PROMPT_LENGTH = 2048
+
+# Value type held by a _DoubleCache. Hooks run under the system python3, so
+# this module avoids PEP 695 syntax to keep importing on Python 3.11
+T = TypeVar("T")
+
+
+# Common words dropped during keyword extraction
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "with",
+        "by",
+        "from",
+        "up",
+        "about",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "if",
+        "when",
+        "where",
+        "why",
+        "how",
+        "what",
+        "which",
+        "who",
+        "whom",
+        "whose",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "me",
+        "my",
+        "myself",
+        "we",
+        "our",
+        "ours",
+        "ourselves",
+        "you",
+        "your",
+        "yours",
+        "yourself",
+        "yourselves",
+        "he",
+        "him",
+        "his",
+        "himself",
+        "she",
+        "her",
+        "hers",
+        "herself",
+        "it",
+        "its",
+        "itself",
+        "they",
+        "them",
+        "their",
+        "theirs",
+        "themselves",
+    }
+)
+
+# Source file extensions prioritized during keyword extraction
+_TECH_EXTENSIONS = frozenset(
+    {"py", "js", "ts", "java", "cpp", "go", "rb", "php", "swift", "kt"}
+)
+
+# Technical terms prioritized during keyword extraction
+_TECH_TERMS = frozenset(
+    {
+        "api",
+        "json",
+        "xml",
+        "html",
+        "css",
+        "sql",
+        "git",
+        "docker",
+        "kubernetes",
+        "aws",
+        "azure",
+        "gcp",
+    }
+)
+
+# Either kind of technical word, for a single membership test per word
+_TECH_WORDS = _TECH_EXTENSIONS | _TECH_TERMS
+
+
+def _index_alternatives(
+    entries: Iterable[tuple[str, str]],
+) -> tuple[dict[str, frozenset[str]], tuple[tuple[str, str], ...]]:
+    """
+    Split ``\\b(?:alt|...)\\b`` classification patterns by alternative kind.
+
+    Single-word alternatives go into a word index probed with the prompt's
+    tokens; everything else (multi-word phrases, ``.*`` gaps) is kept as a
+    narrower pattern for the regex fallback.
+
+    Args:
+        entries: (<category>_<label>, pattern source) pairs
+
+    Returns:
+        Tuple of (word -> matched names, (name, phrase pattern source) pairs)
+    """
+    words: dict[str, set[str]] = {}
+    phrases: list[tuple[str, str]] = []
+    for name, source in entries:
+        body = source.removeprefix(r"\b(?:").removesuffix(r")\b")
+        phrase_alternatives: list[str] = []
+        for alternative in body.split("|"):
+            if re.fullmatch(r"\w+", alternative):
+                words.setdefault(alternative, set()).add(name)
+            else:
+                phrase_alternatives.append(alternative)
+        if phrase_alternatives:
+            phrases.append((name, rf"\b(?:{'|'.join(phrase_alternatives)})\b"))
+    return {word: frozenset(names) for word, names in words.items()}, tuple(phrases)
+
+
+def _recent_matches(
+    ops: Iterable[dict[str, Any]],
+    predicate: Callable[[dict[str, Any]], bool],
+    limit: int,
+) -> list[dict[str, Any]]:
+    """
+    Return up to ``limit`` of the most recent ops matching ``predicate``.
+
+    ``ops`` must yield newest first; iteration stops as soon as ``limit``
+    matches are found, so callers that only need a threshold count never
+    walk the full history.
+
+    Returns:
+        Matching ops, newest first
+    """
+    matches: list[dict[str, Any]] = []
+    for op in ops:
+        if predicate(op):
+            matches.append(op)
+            if len(matches) == limit:
+                break
+    return matches
+
+
+class _DoubleCache(Generic[T]):  # noqa: UP046
+    """
+    Two-level cache modelled on CPython's ``re`` compile cache.
+
+    A small FIFO primary dict serves hot entries with a single lookup, backed
+    by a larger LRU secondary. Keys are prompt hashes so the cache never holds
+    references to the prompt strings themselves.
+    """
+
+    def __init__(self, primary_size: int = 64, secondary_size: int = 256) -> None:
+        self._primary: dict[int, T] = {}
+        self._secondary: OrderedDict[int, T] = OrderedDict()
+        self._primary_size = primary_size
+        self._secondary_size = secondary_size
+
+    def get(self, key: int) -> T | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        value = self._primary.get(key)
+        if value is not None:
+            return value
+
+        value = self._secondary.get(key)
+        if value is not None:
+            self._secondary.move_to_end(key)
+            self._put_primary(key, value)
+        return value
+
+    def put(self, key: int, value: T) -> None:
+        """Store ``value`` in both cache levels."""
+        self._put_primary(key, value)
+        self._secondary[key] = value
+        self._secondary.move_to_end(key)
+        if len(self._secondary) > self._secondary_size:
+            self._secondary.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._primary.clear()
+        self._secondary.clear()
+
+    def _put_primary(self, key: int, value: T) -> None:
+        if len(self._primary) >= self._primary_size:
+            del self._primary[next(iter(self._primary))]
+        self._primary[key] = value
+
+
+def _prompt_cache(func: Callable[[str], T]) -> Callable[[str], T]:  # noqa: UP047
+    """Cache a single-prompt function in a bounded ``_DoubleCache``."""
+    cache: _DoubleCache[T] = _DoubleCache()
+
+    @wraps(func)
+    def wrapper(prompt: str) -> T:
+        if len(prompt) > _MAX_CACHED_PROMPT_LENGTH:
+            return func(prompt)
+
+        key = hash(prompt)
+        result = cache.get(key)
+        if result is None:
+            result = func(prompt)
+            cache.put(key, result)
+        return result
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@dataclass(slots=True, frozen=True)
+class AnalyzedContext(Mapping[str, Any]):
+    """
+    Immutable result of ``ContextAnalyzer.analyze_prompt_context``.
+
+    Also a read-only mapping over its fields so existing ``context["intent"]``
+    and ``context.get(...)`` callers keep working unchanged.
+    """
+
+    intent: str = "general"
+    scope: str = "moderate"
+    urgency: str = "normal"
+    keywords: tuple[str, ...] = ()
+    suggested_tools: tuple[tuple[str, str], ...] = ()
+    suggested_agents: tuple[tuple[str, str], ...] = ()
+    confidence: float = 0.0
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _ANALYZED_CONTEXT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ANALYZED_CONTEXT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_ANALYZED_CONTEXT_FIELDS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the analysis in the legacy dict-of-lists shape."""
+        result = asdict(self)
+        for key in ("keywords", "suggested_tools", "suggested_agents"):
+            result[key] = list(result[key])
+        return result
+
+
+_ANALYZED_CONTEXT_FIELDS = tuple(field.name for field in fields(AnalyzedContext))
+
+# Shared result for trivial prompts; safe to reuse since AnalyzedContext is frozen
+_TRIVIAL_CONTEXT = AnalyzedContext(intent="trivial")
 
 
 class ContextAnalyzer:
@@ -55,43 +333,187 @@ class ContextAnalyzer:
     # Cached compiled regex patterns for performance
     _intent_patterns: ClassVar[list[tuple[re.Pattern[str], str]]] = [
         (
-            re.compile(r"\b(mcp|mcp server|servers.*access|what.*servers)\b"),
+            re.compile(r"\b(?:mcp|servers.*access|what.*servers)\b"),
             "mcp_query",
         ),
-        (re.compile(r"\b(find|search|locate|look for)\b"), "search"),
-        (re.compile(r"\b(debug|fix|error|bug|issue)\b"), "debug"),
-        (re.compile(r"\b(optimize|improve|speed up|performance)\b"), "optimize"),
-        (re.compile(r"\b(review|audit|check|analyze)\b"), "review"),
-        (re.compile(r"\b(refactor|modernize|clean up)\b"), "refactor"),
-        (re.compile(r"\b(test|coverage|unit test)\b"), "test"),
-        (re.compile(r"\b(implement|add|create|build)\b"), "implement"),
+        (re.compile(r"\b(?:find|search|locate|look for)\b"), "search"),
+        (re.compile(r"\b(?:debug|fix|error|bug|issue)\b"), "debug"),
+        (re.compile(r"\b(?:optimize|improve|speed up|performance)\b"), "optimize"),
+        (re.compile(r"\b(?:review|audit|check|analyze)\b"), "review"),
+        (re.compile(r"\b(?:refactor|modernize|clean up)\b"), "refactor"),
+        (re.compile(r"\b(?:test|coverage|unit test)\b"), "test"),
+        (re.compile(r"\b(?:implement|add|create|build)\b"), "implement"),
     ]
 
-    _scope_extensive_pattern = re.compile(r"\b(all|every|entire|whole|throughout)\b")
-    _scope_targeted_pattern = re.compile(r"\b(specific|particular|single|just)\b")
-    _urgency_high_pattern = re.compile(r"\b(asap|urgent|quickly|fast)\b")
-    _urgency_low_pattern = re.compile(r"\b(when you can|eventually|later)\b")
+    _scope_patterns: ClassVar[list[tuple[re.Pattern[str], str]]] = [
+        (re.compile(r"\b(?:all|every|entire|whole|throughout)\b"), "extensive"),
+        (re.compile(r"\b(?:specific|particular|single|just)\b"), "targeted"),
+    ]
+    _urgency_patterns: ClassVar[list[tuple[re.Pattern[str], str]]] = [
+        (re.compile(r"\b(?:asap|urgent|quickly|fast)\b"), "high"),
+        (re.compile(r"\b(?:when you can|eventually|later)\b"), "low"),
+    ]
+
+    # Category -> ((<category>_<label>, label) in priority order, default
+    # label). Every string is interned so the labels handed out are always
+    # the same objects and group names are built once rather than per call.
+    _classifications: ClassVar[dict[str, tuple[tuple[tuple[str, str], ...], str]]] = {
+        category: (
+            tuple(
+                (sys.intern(f"{category}_{label}"), sys.intern(label))
+                for _, label in patterns
+            ),
+            sys.intern(default),
+        )
+        for category, patterns, default in (
+            ("intent", _intent_patterns, "general"),
+            ("scope", _scope_patterns, "moderate"),
+            ("urgency", _urgency_patterns, "normal"),
+        )
+    }
+
+    # (<category>_<label>, pattern source) for every classification pattern
+    _classify_entries: ClassVar[tuple[tuple[str, str], ...]] = tuple(
+        (sys.intern(f"{category}_{label}"), pattern.pattern)
+        for category, patterns in (
+            ("intent", _intent_patterns),
+            ("scope", _scope_patterns),
+            ("urgency", _urgency_patterns),
+        )
+        for pattern, label in patterns
+    )
+
+    # Word -> matched names for single-word alternatives, and the remaining
+    # phrase alternatives as narrower patterns
+    _word_labels, _phrase_entries = _index_alternatives(_classify_entries)
+
+    # Single-pass union of the phrase patterns. Each alternative is a
+    # lookahead so overlapping hits are still reported.
+    _phrase_union: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(f"(?=(?P<{name}>{source}))" for name, source in _phrase_entries)
+    )
+
+    # Literal pieces every phrase match must contain; the phrase scan only
+    # runs when some phrase has all of its pieces in the prompt
+    _phrase_gates: ClassVar[tuple[tuple[str, ...], ...]] = tuple(
+        tuple(alternative.split(".*"))
+        for _, source in _phrase_entries
+        for alternative in source.removeprefix(r"\b(?:").removesuffix(r")\b").split("|")
+    )
+
+    # Intent -> (suggested tools, suggested agents)
+    _intent_suggestions: ClassVar[dict[str, _Suggestions]] = {
+        "mcp_query": (
+            (
+                ("ListMcpResourcesTool", "List available MCP servers and resources"),
+                ("ReadMcpResourceTool", "Read specific MCP resource content"),
+            ),
+            (),
+        ),
+        "search": (
+            (
+                (
+                    "search_for_pattern",
+                    "Use with context lines for efficient searching",
+                ),
+                ("find_symbol", "Navigate code symbols directly"),
+            ),
+            (),
+        ),
+        "debug": (
+            (("getDiagnostics", "Get language server diagnostics"),),
+            (
+                (
+                    "debugger",
+                    'Use Task(subagent_type="debugger") for complex debugging',
+                ),
+            ),
+        ),
+        "optimize": (
+            (("benchmark_run", "Run performance benchmarks"),),
+            (
+                (
+                    "performance-engineer",
+                    'Use Task(subagent_type="performance-engineer")',
+                ),
+            ),
+        ),
+        "review": (
+            (("zen__codereview", "Zen-managed comprehensive code review"),),
+            (("code-reviewer", 'Use Task(subagent_type="code-reviewer")'),),
+        ),
+        "refactor": (
+            (("replace_symbol_body", "Replace code symbols efficiently"),),
+            (("refactor", 'Use Task(subagent_type="refactor") for modernization'),),
+        ),
+        "test": (
+            (
+                ("zen__testgen", "Generate comprehensive test suites"),
+                ("executeCode", "Execute test code in IDE"),
+            ),
+            (),
+        ),
+        "implement": (
+            (
+                ("zen__chat", "Plan implementation strategy with Zen"),
+                ("insert_after_symbol", "Add new code after existing symbols"),
+            ),
+            (),
+        ),
+    }
+
+    # (intent, scope) overrides that replace the intent's default suggestions
+    _scoped_intent_suggestions: ClassVar[dict[tuple[str, str], _Suggestions]] = {
+        ("search", "extensive"): (
+            (),
+            (
+                (
+                    "general-purpose",
+                    "Use Task for extensive searches to save context",
+                ),
+            ),
+        ),
+    }
+
     _word_pattern = re.compile(r"\b\w+\b")
-    _tech_file_pattern = re.compile(r".*\.(py|js|ts|java|cpp|go|rb|php|swift|kt)")
 
-    def __init__(self) -> None:
-        """Initialize the context analyzer with required dependencies."""
+    # Dependencies are created on first use: trivial-prompt checks and intent
+    # analysis never touch shared state or pattern history.
+    @cached_property
+    def state_manager(self) -> "HookStateManager | None":
+        """Shared hook state manager, or None if unavailable."""
+        manager: HookStateManager | None = self._create_dependency(
+            "shared_state", "HookStateManager"
+        )
+        return manager
+
+    @cached_property
+    def pattern_detector(self) -> "PatternDetector | None":
+        """Workflow pattern detector, or None if unavailable."""
+        detector: PatternDetector | None = self._create_dependency(
+            "pattern_detector", "PatternDetector"
+        )
+        return detector
+
+    @cached_property
+    def session_tracker(self) -> "SessionTracker | None":
+        """Session tool-usage tracker, or None if unavailable."""
+        tracker: SessionTracker | None = self._create_dependency(
+            "shared_state", "SessionTracker"
+        )
+        return tracker
+
+    @staticmethod
+    def _create_dependency(module_name: str, class_name: str) -> Any:
+        """Import and instantiate a core class, returning None on failure."""
         try:
-            self.state_manager: HookStateManager | None = HookStateManager()
-            self.pattern_detector: PatternDetector | None = PatternDetector()
-            self.session_tracker: SessionTracker | None = SessionTracker()
+            return getattr(_import_core_module(module_name), class_name)()
         except Exception as e:
             # Graceful fallback if dependencies aren't available
-            self.state_manager = None
-            self.pattern_detector = None
-            self.session_tracker = None
-            # Log error but don't fail initialization
-            print(
-                f"Warning: ContextAnalyzer initialized with limited "
-                f"functionality: {e}"
-            )
+            _log.warning("ContextAnalyzer %s unavailable: %s", class_name, e)
+            return None
 
-    def analyze_prompt_context(self, prompt: str) -> dict[str, Any]:
+    def analyze_prompt_context(self, prompt: str) -> AnalyzedContext:
         """
         Analyze user prompt for context clues and intent.
 
@@ -99,8 +521,9 @@ class ContextAnalyzer:
             prompt: The user's input prompt to analyze
 
         Returns:
-            Dictionary containing analysis results:
-            - intent: Primary intent detected
+            AnalyzedContext with the analysis results:
+            - intent: Primary intent detected ("trivial" for acknowledgements
+              and simple arithmetic, which skip the rest of the analysis)
             - scope: Task scope (extensive, targeted, moderate)
             - urgency: Urgency level (high, normal, low)
             - keywords: Important keywords extracted
@@ -111,357 +534,200 @@ class ContextAnalyzer:
             return self._get_default_context()
 
         try:
-            suggested_tools: list[tuple[str, str]] = []
-            suggested_agents: list[tuple[str, str]] = []
-
-            context: dict[str, Any] = {
-                "intent": self._detect_intent(prompt),
-                "scope": self._detect_scope(prompt),
-                "urgency": self._detect_urgency(prompt),
-                "keywords": list(self._extract_keywords(prompt)),
-                "suggested_tools": suggested_tools,
-                "suggested_agents": suggested_agents,
-                "confidence": self._calculate_confidence(prompt),
-            }
-
-            # Add intent-specific suggestions
-            self._add_intent_suggestions(context)
-
-            return context
-
+            return self._analyze_prompt(prompt)
         except Exception as e:
-            print(f"Error analyzing prompt context: {e}")
+            _log.warning("Error analyzing prompt context: %s", e)
             return self._get_default_context()
 
-    def _get_default_context(self) -> dict[str, Any]:
-        """Return default context when analysis fails."""
-        return {
-            "intent": "general",
-            "scope": "moderate",
-            "urgency": "normal",
-            "keywords": [],
-            "suggested_tools": [],
-            "suggested_agents": [],
-            "confidence": 0.0,
-        }
-
     @staticmethod
-    @lru_cache(maxsize=256)
-    def _detect_intent(prompt: str) -> str:
+    @_prompt_cache
+    def _analyze_prompt(prompt: str) -> AnalyzedContext:
         """
-        Detect primary intent from prompt using regex patterns.
+        Analyze a non-empty prompt; cached so repeat prompts skip the work.
 
         Args:
-            prompt: User input to analyze
+            prompt: The user's input prompt to analyze
 
         Returns:
-            Intent string (mcp_query, search, debug, optimize, etc.)
+            AnalyzedContext for the prompt
         """
-        try:
-            prompt_lower = prompt.lower()
-
-            for pattern, intent in ContextAnalyzer._intent_patterns:
-                if pattern.search(prompt_lower):
-                    return intent
-
-            return "general"
-        except Exception:
-            return "general"
+        # Acknowledgements and simple arithmetic need no regex work
+        if ContextAnalyzer._is_trivial_prompt(prompt):
+            return _TRIVIAL_CONTEXT
+
+        prompt_lower = prompt.lower()
+        words = ContextAnalyzer._words(prompt_lower)
+        hits = ContextAnalyzer._match_labels(prompt_lower, words)
+        intent, scope, urgency = ContextAnalyzer._resolve_flags(hits)
+        keywords = ContextAnalyzer._rank_keywords(words)
+        intent_matches = sum(1 for label in hits if label.startswith("intent_"))
+        suggested_tools, suggested_agents = ContextAnalyzer._get_intent_suggestions(
+            intent, scope
+        )
+
+        return AnalyzedContext(
+            intent=intent,
+            scope=scope,
+            urgency=urgency,
+            keywords=keywords,
+            suggested_tools=suggested_tools,
+            suggested_agents=suggested_agents,
+            confidence=ContextAnalyzer._calculate_confidence(
+                prompt_lower, keywords, intent_matches
+            ),
+        )
+
+    def _get_default_context(self) -> AnalyzedContext:
+        """Return default context when analysis fails."""
+        return AnalyzedContext()
 
-    def _detect_scope(self, prompt: str) -> str:
+    @staticmethod
+    def _match_labels(prompt_lower: str, words: Iterable[str]) -> set[str]:
         """
-        Detect scope of the task from prompt content.
+        Collect every ``<category>_<label>`` whose pattern matches.
+
+        Single-word alternatives are looked up per token; the phrase patterns
+        are only scanned when the prompt contains their literal pieces.
 
         Args:
-            prompt: User input to analyze
+            prompt_lower: Lowercased user input
+            words: Tokens of ``prompt_lower`` (see ``_words``)
 
         Returns:
-            Scope string (extensive, targeted, moderate)
+            Set of matched ``<category>_<label>`` names
         """
-        try:
-            prompt_lower = prompt.lower()
-
-            if self._scope_extensive_pattern.search(prompt_lower):
-                return "extensive"
-            elif self._scope_targeted_pattern.search(prompt_lower):
-                return "targeted"
-            else:
-                return "moderate"
-        except Exception:
-            return "moderate"
+        word_labels = ContextAnalyzer._word_labels
+        hits: set[str] = set()
+        for word in word_labels.keys() & words:
+            hits |= word_labels[word]
+
+        if any(
+            all(piece in prompt_lower for piece in pieces)
+            for pieces in ContextAnalyzer._phrase_gates
+        ):
+            hits.update(
+                match.lastgroup
+                for match in ContextAnalyzer._phrase_union.finditer(prompt_lower)
+                if match.lastgroup
+            )
+        return hits
 
-    def _detect_urgency(self, prompt: str) -> str:
+    @staticmethod
+    def _resolve_flags(hits: set[str]) -> tuple[str, str, str]:
         """
-        Detect urgency level from prompt language.
+        Pick the highest-priority intent, scope and urgency from matched labels.
 
         Args:
-            prompt: User input to analyze
+            hits: Union group names returned by ``_match_labels``
 
         Returns:
-            Urgency string (high, normal, low)
+            Tuple of (intent, scope, urgency)
         """
-        try:
-            prompt_lower = prompt.lower()
-
-            if self._urgency_high_pattern.search(prompt_lower):
-                return "high"
-            elif self._urgency_low_pattern.search(prompt_lower):
-                return "low"
-            else:
-                return "normal"
-        except Exception:
-            return "normal"
+        intent, scope, urgency = (
+            next(
+                (label for name, label in labels if name in hits),
+                default,
+            )
+            for labels, default in ContextAnalyzer._classifications.values()
+        )
+        return intent, scope, urgency
 
     @staticmethod
-    @lru_cache(maxsize=256)
-    def _extract_keywords(prompt: str) -> tuple[str, ...]:
+    def _words(prompt_lower: str) -> list[str]:
         """
-        Extract important keywords from prompt, prioritizing technical terms.
+        Split a lowercased prompt into ``\\b\\w+\\b`` tokens.
 
         Args:
-            prompt: User input to analyze
+            prompt_lower: Lowercased user input
 
         Returns:
-            Tuple of extracted keywords (hashable for caching)
+            Tokens in prompt order
         """
-        try:
-            # Remove common words
-            stop_words = {
-                "the",
-                "a",
-                "an",
-                "and",
-                "or",
-                "but",
-                "in",
-                "on",
-                "at",
-                "to",
-                "for",
-                "with",
-                "by",
-                "from",
-                "up",
-                "about",
-                "into",
-                "through",
-                "during",
-                "before",
-                "after",
-                "above",
-                "below",
-                "if",
-                "when",
-                "where",
-                "why",
-                "how",
-                "what",
-                "which",
-                "who",
-                "whom",
-                "whose",
-                "this",
-                "that",
-                "these",
-                "those",
-                "i",
-                "me",
-                "my",
-                "myself",
-                "we",
-                "our",
-                "ours",
-                "ourselves",
-                "you",
-                "your",
-                "yours",
-                "yourself",
-                "yourselves",
-                "he",
-                "him",
-                "his",
-                "himself",
-                "she",
-                "her",
-                "hers",
-                "herself",
-                "it",
-                "its",
-                "itself",
-                "they",
-                "them",
-                "their",
-                "theirs",
-                "themselves",
-            }
-
-            words = ContextAnalyzer._word_pattern.findall(prompt.lower())
-            keywords = [w for w in words if w not in stop_words and len(w) > 2]
-
-            # Prioritize technical terms and file extensions
-            tech_terms = []
-            regular_terms = []
-
-            for word in keywords:
-                if ContextAnalyzer._tech_file_pattern.match(f"test.{word}") or word in {
-                    "api",
-                    "json",
-                    "xml",
-                    "html",
-                    "css",
-                    "sql",
-                    "git",
-                    "docker",
-                    "kubernetes",
-                    "aws",
-                    "azure",
-                    "gcp",
-                }:
-                    tech_terms.append(word)
-                else:
-                    regular_terms.append(word)
-
-            # Return top 10 keywords with tech terms prioritized
-            result = tech_terms[:5] + regular_terms[:5]
-            return tuple(result[:10])
-
-        except Exception:
-            return ()
-
-    def _calculate_confidence(self, prompt: str) -> float:
+        if prompt_lower.isascii():
+            # C-level tokenization; equivalent to _word_pattern for ASCII
+            return prompt_lower.translate(_ASCII_NON_WORD_TO_SPACE).split()
+        return ContextAnalyzer._word_pattern.findall(prompt_lower)
+
+    @staticmethod
+    def _rank_keywords(words: Iterable[str]) -> tuple[str, ...]:
         """
-        Calculate confidence score for the analysis based on prompt characteristics.
+        Drop stop words and short words, prioritizing technical terms.
 
         Args:
-            prompt: User input to analyze
+            words: Lowercased words in prompt order
 
         Returns:
-            Confidence score between 0.0 and 1.0
+            Up to 5 technical terms followed by up to 5 regular terms
         """
-        try:
-            score = 0.5  # Base confidence
-
-            # Higher confidence for longer, more specific prompts
-            word_count = len(prompt.split())
-            if word_count > 10:
-                score += 0.2
-            elif word_count > 5:
-                score += 0.1
-
-            # Higher confidence if technical keywords are present
-            keywords = self._extract_keywords(prompt)
-            if len(keywords) >= 3:
-                score += 0.2
-
-            # Higher confidence if intent patterns match strongly
-            intent_matches = sum(
-                1
-                for pattern, _ in self._intent_patterns
-                if pattern.search(prompt.lower())
-            )
-            if intent_matches > 1:
-                score += 0.1
-
-            return min(1.0, score)
+        tech_terms: list[str] = []
+        regular_terms: list[str] = []
+
+        for word in words:
+            if word in _STOP_WORDS or len(word) <= 2:
+                continue
+            if word in _TECH_WORDS:
+                tech_terms.append(word)
+            else:
+                regular_terms.append(word)
+            # Only the first 5 of each kind are kept; stop once both are full
+            if len(tech_terms) >= 5 and len(regular_terms) >= 5:
+                break
 
-        except Exception:
-            return 0.5
+        # Return top 10 keywords with tech terms prioritized
+        return tuple(tech_terms[:5] + regular_terms[:5])
 
-    def _add_intent_suggestions(self, context: dict[str, Any]) -> None:
+    @staticmethod
+    def _calculate_confidence(
+        prompt_lower: str, keywords: tuple[str, ...], intent_matches: int
+    ) -> float:
         """
-        Add intent-specific tool and agent suggestions to context.
+        Calculate confidence score for the analysis based on prompt characteristics.
 
         Args:
-            context: Context dictionary to modify with suggestions
-        """
-        intent = context["intent"]
-        scope = context["scope"]
-
-        try:
-            # Tool suggestions based on intent
-            if intent == "mcp_query":
-                context["suggested_tools"].append(
-                    ("ListMcpResourcesTool", "List available MCP servers and resources")
-                )
-                context["suggested_tools"].append(
-                    ("ReadMcpResourceTool", "Read specific MCP resource content")
-                )
+            prompt_lower: Lowercased user input to analyze
+            keywords: Keywords already extracted from the prompt
+            intent_matches: Number of distinct intents matched by the prompt
 
-            elif intent == "search":
-                if scope == "extensive":
-                    context["suggested_agents"].append(
-                        (
-                            "general-purpose",
-                            "Use Task for extensive searches to save context",
-                        )
-                    )
-                else:
-                    context["suggested_tools"].append(
-                        (
-                            "search_for_pattern",
-                            "Use with context lines for efficient searching",
-                        )
-                    )
-                    context["suggested_tools"].append(
-                        ("find_symbol", "Navigate code symbols directly")
-                    )
+        Returns:
+            Confidence score between 0.0 and 1.0
+        """
+        score = 0.5  # Base confidence
 
-            elif intent == "debug":
-                context["suggested_agents"].append(
-                    (
-                        "debugger",
-                        'Use Task(subagent_type="debugger") for complex debugging',
-                    )
-                )
-                context["suggested_tools"].append(
-                    ("getDiagnostics", "Get language server diagnostics")
-                )
+        # Higher confidence for longer, more specific prompts. Counting stops
+        # past the largest threshold, so long prompts aren't split in full.
+        word_count = len(prompt_lower.split(maxsplit=11))
+        if word_count > 10:
+            score += 0.2
+        elif word_count > 5:
+            score += 0.1
 
-            elif intent == "optimize":
-                context["suggested_agents"].append(
-                    (
-                        "performance-engineer",
-                        'Use Task(subagent_type="performance-engineer")',
-                    )
-                )
-                context["suggested_tools"].append(
-                    ("benchmark_run", "Run performance benchmarks")
-                )
+        # Higher confidence if technical keywords are present
+        if len(keywords) >= 3:
+            score += 0.2
 
-            elif intent == "review":
-                context["suggested_agents"].append(
-                    ("code-reviewer", 'Use Task(subagent_type="code-reviewer")')
-                )
-                context["suggested_tools"].append(
-                    ("zen__codereview", "Zen-managed comprehensive code review")
-                )
+        # Higher confidence if intent patterns match strongly
+        if intent_matches > 1:
+            score += 0.1
 
-            elif intent == "refactor":
-                context["suggested_agents"].append(
-                    ("refactor", 'Use Task(subagent_type="refactor") for modernization')
-                )
-                context["suggested_tools"].append(
-                    ("replace_symbol_body", "Replace code symbols efficiently")
-                )
+        return min(1.0, score)
 
-            elif intent == "test":
-                context["suggested_tools"].append(
-                    ("zen__testgen", "Generate comprehensive test suites")
-                )
-                context["suggested_tools"].append(
-                    ("executeCode", "Execute test code in IDE")
-                )
+    @staticmethod
+    def _get_intent_suggestions(intent: str, scope: str) -> _Suggestions:
+        """
+        Look up intent-specific tool and agent suggestions.
 
-            elif intent == "implement":
-                context["suggested_tools"].append(
-                    ("zen__chat", "Plan implementation strategy with Zen")
-                )
-                context["suggested_tools"].append(
-                    ("insert_after_symbol", "Add new code after existing symbols")
-                )
+        Args:
+            intent: Detected intent
+            scope: Detected scope
 
-        except Exception as e:
-            print(f"Warning: Failed to add intent suggestions: {e}")
+        Returns:
+            Tuple of (suggested tools, suggested agents)
+        """
+        return (
+            ContextAnalyzer._scoped_intent_suggestions.get((intent, scope))
+            or ContextAnalyzer._intent_suggestions.get(intent)
+            or ((), ())
+        )
 
     def get_contextual_suggestions(
         self, tool_name: str, tool_input: dict[str, Any]
@@ -482,14 +748,19 @@ class ContextAnalyzer:
             if not self.session_tracker:
                 return suggestions
 
-            # Get recent operations for pattern detection
-            recent_ops = self.session_tracker.get_recent_operations(seconds=60)
+            # Recent operations for pattern detection, newest first; state is
+            # only read if one of the branches below consumes it
+            recent_ops = self.session_tracker.iter_recent_operations(seconds=60)
 
             # File reading patterns
             if tool_name == "Read":
-                recent_reads = [op for op in recent_ops if op["tool"] == "Read"]
+                recent_reads = _recent_matches(
+                    recent_ops, lambda op: op["tool"] == "Read", limit=3
+                )
                 if len(recent_reads) >= 2:
-                    files = [op.get("file_path", "unknown") for op in recent_reads[-3:]]
+                    files = [
+                        op.get("file_path", "unknown") for op in reversed(recent_reads)
+                    ]
                     suggestions.append(
                         f"📚 Multiple file reads detected. Consider batching with "
                         f"read_multiple_files: {files[:3]}"
@@ -499,11 +770,13 @@ class ContextAnalyzer:
             elif tool_name == "Bash":
                 command = tool_input.get("command", "")
                 if "grep" in command:
-                    recent_greps = [
-                        op
-                        for op in recent_ops
-                        if op["tool"] == "Bash" and "grep" in op.get("command", "")
-                    ]
+                    recent_greps = _recent_matches(
+                        recent_ops,
+                        lambda op: (
+                            op["tool"] == "Bash" and "grep" in op.get("command", "")
+                        ),
+                        limit=2,
+                    )
                     if len(recent_greps) >= 2:
                         suggestions.append(
                             "🔍 Multiple grep commands detected. Switch to 'rg' "
@@ -512,9 +785,9 @@ class ContextAnalyzer:
 
             # Symbol search patterns
             elif tool_name == "find_symbol":
-                recent_symbols = [
-                    op for op in recent_ops if op["tool"] == "find_symbol"
-                ]
+                recent_symbols = _recent_matches(
+                    recent_ops, lambda op: op["tool"] == "find_symbol", limit=3
+                )
                 if len(recent_symbols) >= 3:
                     suggestions.append(
                         "🎯 Multiple symbol searches detected. Consider batching or "
@@ -529,7 +802,7 @@ class ContextAnalyzer:
                         suggestions.append(f"🔄 {workflow.optimization_suggestion}")
 
         except Exception as e:
-            print(f"Warning: Failed to generate contextual suggestions: {e}")
+            _log.warning("Failed to generate contextual suggestions: %s", e)
 
         return suggestions
 
@@ -546,14 +819,10 @@ class ContextAnalyzer:
         if not prompt or not isinstance(prompt, str):
             return True
 
-        trivial_patterns = [
-            r"^(yes|no|ok|okay|sure|alright|fine|got it|understood)\.?$",
-            r"^(please do|do it|go ahead|proceed|continue|thanks|thank you)\.?$",
-            r"^(yep|yeah|nope|nah|cool|great|good|perfect|exactly)\.?$",
-            r"^(right|correct|indeed|absolutely)\.?$",
-            r"^\d+\s*[\+\-\*/]\s*\d+\s*\??$",  # Simple math like "2 + 2?"
-            r"^what is \d+\s*[\+\-\*/]\s*\d+\s*\??$",  # Simple math questions
-        ]
-
-        prompt_lower = prompt.lower().strip()
-        return any(re.match(pattern, prompt_lower) for pattern in trivial_patterns)
+        return self._is_trivial_prompt(prompt)
+
+    @staticmethod
+    @_prompt_cache
+    def _is_trivial_prompt(prompt: str) -> bool:
+        """Cached trivial check for a non-empty prompt string."""
+        return is_trivial_prompt(prompt)
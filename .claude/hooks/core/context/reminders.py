@@ -6,10 +6,84 @@ Provides contextual reminders and suggestions based on user intent and context.
 Part of the Claude Code hooks system for enhanced user guidance.
 """
 
+import logging
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 from .analyzer import ContextAnalyzer
 
+_log = logging.getLogger("claude_hooks.context")
+
+# Intent -> reminders shown for prompts with that intent
+_INTENT_REMINDERS: dict[str, tuple[str, ...]] = {
+    "mcp_query": (
+        "🔌 MCP servers: Use ListMcpResourcesTool to see all available MCP servers",
+        "📋 Resource discovery: ReadMcpResourceTool for specific MCP resource content",
+    ),
+    "search": (
+        "🔍 Search efficiently: Use 'rg' for text, 'fd' for files, "
+        "Task for extensive searches",
+        "🎯 Code navigation: Prefer Serena's find_symbol over reading entire files",
+    ),
+    "debug": (
+        "🐛 Debug systematically: Task(subagent_type='debugger') handles "
+        "complex issues",
+        "📊 Get diagnostics: Use getDiagnostics for language server insights",
+    ),
+    "optimize": (
+        "⚡ Measure first: Always profile before optimizing",
+        "🚀 Performance focus: Use Task(subagent_type='performance-engineer')",
+    ),
+    "review": (
+        "👁️ Comprehensive review: Use Task(subagent_type='code-reviewer')",
+        "🔒 Security focus: Consider zen__secaudit for security-critical code",
+    ),
+    "refactor": (
+        "🔄 Plan refactoring: Use Task(subagent_type='refactor') for major changes",
+        "🎨 Code quality: Focus on readability and maintainability",
+    ),
+    "test": (
+        "🧪 Test strategy: Use zen__testgen for comprehensive test suites",
+        "✅ Coverage matters: Aim for edge cases and error conditions",
+    ),
+    "implement": (
+        "📝 Plan first: Use zen__chat to strategize implementation approach",
+        "🏗️ Build incrementally: Start with core functionality, then extend",
+    ),
+}
+
+# Tool name -> reminders shown before that tool runs
+_TOOL_REMINDERS: dict[str, tuple[str, ...]] = {
+    "Read": (
+        "📚 Consider read_multiple_files for multiple file operations",
+        "🎯 Use find_symbol for specific code elements instead of reading entire files",
+    ),
+    "Bash": (
+        "🔍 Use 'rg' instead of 'grep' for 10-100x performance improvement",
+        "📂 Use 'fd' instead of 'find' for faster file discovery",
+    ),
+    "find_symbol": (
+        "🗺️ Use get_symbols_overview first for broader context",
+        "⚡ Batch multiple symbol searches for efficiency",
+    ),
+    "Write": (
+        "✏️ Prefer editing existing files over creating new ones",
+        "📝 Use absolute paths for consistency",
+    ),
+    "zen__chat": (
+        "🧠 Enable use_websearch=true for current best practices",
+        "🎯 Be specific about complexity level for optimal subagent allocation",
+    ),
+}
+
+# Most reminders returned by generate_reminders
+_MAX_REMINDERS = 4
+
+# Keyword groups that trigger best-practice reminders
+_FILE_KEYWORDS = frozenset({"file", "files", "read", "write"})
+_GIT_KEYWORDS = frozenset({"git", "commit", "branch", "merge"})
+_PERFORMANCE_KEYWORDS = frozenset({"performance", "slow", "optimize", "speed"})
+
 
 class IntelligentReminder:
     """
@@ -23,18 +97,28 @@ class IntelligentReminder:
     - Pattern-based workflow guidance
     """
 
-    def __init__(self) -> None:
-        """Initialize the intelligent reminder system."""
+    __slots__ = ("context_analyzer",)
+
+    def __init__(self, analyzer: ContextAnalyzer | None = None) -> None:
+        """
+        Initialize the intelligent reminder system.
+
+        Args:
+            analyzer: Shared analyzer to reuse; a new one is created if omitted
+        """
+        if analyzer is not None:
+            self.context_analyzer: ContextAnalyzer | None = analyzer
+            return
+
         try:
-            self.context_analyzer: ContextAnalyzer | None = ContextAnalyzer()
+            self.context_analyzer = ContextAnalyzer()
         except Exception as e:
             self.context_analyzer = None
-            print(
-                f"Warning: IntelligentReminder initialized with limited "
-                f"functionality: {e}"
+            _log.warning(
+                "IntelligentReminder initialized with limited functionality: %s", e
             )
 
-    def generate_reminders(self, prompt: str, context: dict[str, Any]) -> list[str]:
+    def generate_reminders(self, prompt: str, context: Mapping[str, Any]) -> list[str]:
         """
         Generate smart reminders based on prompt and context analysis.
 
@@ -49,121 +133,76 @@ class IntelligentReminder:
             return []
 
         reminders: list[str] = []
+        seen: set[str] = set()
 
-        try:
-            # Generate intent-specific reminders
-            self._add_intent_reminders(context, reminders)
-
-            # Generate scope-based reminders
-            self._add_scope_reminders(context, reminders)
+        def add(reminder: str) -> None:
+            # Deduplicate at the source so repeats never take up a slot
+            if reminder not in seen:
+                seen.add(reminder)
+                reminders.append(reminder)
 
-            # Generate urgency-based reminders
-            self._add_urgency_reminders(context, reminders)
-
-            # Generate pattern-based reminders
-            self._add_pattern_reminders(context, reminders)
-
-            # Generate best practice reminders
-            self._add_best_practice_reminders(context, reminders)
+        try:
+            intent = context.get("intent", "general")
+            scope = context.get("scope", "moderate")
+            urgency = context.get("urgency", "normal")
+            keywords = context.get("keywords", ())
+
+            # Intent, scope, urgency, pattern and best practice reminders in
+            # priority order. The first three add at most four, so only the
+            # later helpers (notably workflow pattern detection) can be
+            # skipped once the limit is reached.
+            self._add_intent_reminders(intent, add)
+            self._add_scope_reminders(scope, add)
+            self._add_urgency_reminders(urgency, add)
+            if len(reminders) < _MAX_REMINDERS:
+                self._add_pattern_reminders(add)
+            if len(reminders) < _MAX_REMINDERS:
+                self._add_best_practice_reminders(keywords, add)
 
             # Limit to most relevant reminders
-            return reminders[:4]
+            return reminders[:_MAX_REMINDERS]
 
         except Exception as e:
-            print(f"Warning: Failed to generate reminders: {e}")
+            _log.warning("Failed to generate reminders: %s", e)
             return []
 
-    def _add_intent_reminders(
-        self, context: dict[str, Any], reminders: list[str]
-    ) -> None:
+    @staticmethod
+    def _add_intent_reminders(intent: str, add: Callable[[str], None]) -> None:
         """Add reminders based on detected intent."""
-        intent = context.get("intent", "general")
-
-        intent_reminders = {
-            "mcp_query": [
-                "🔌 MCP servers: Use ListMcpResourcesTool to see all available "
-                "MCP servers",
-                "📋 Resource discovery: ReadMcpResourceTool for specific MCP "
-                "resource content",
-            ],
-            "search": [
-                "🔍 Search efficiently: Use 'rg' for text, 'fd' for files, "
-                "Task for extensive searches",
-                "🎯 Code navigation: Prefer Serena's find_symbol over reading "
-                "entire files",
-            ],
-            "debug": [
-                "🐛 Debug systematically: Task(subagent_type='debugger') handles "
-                "complex issues",
-                "📊 Get diagnostics: Use getDiagnostics for language server insights",
-            ],
-            "optimize": [
-                "⚡ Measure first: Always profile before optimizing",
-                "🚀 Performance focus: Use Task(subagent_type='performance-engineer')",
-            ],
-            "review": [
-                "👁️ Comprehensive review: Use Task(subagent_type='code-reviewer')",
-                "🔒 Security focus: Consider zen__secaudit for security-critical code",
-            ],
-            "refactor": [
-                "🔄 Plan refactoring: Use Task(subagent_type='refactor') for "
-                "major changes",
-                "🎨 Code quality: Focus on readability and maintainability",
-            ],
-            "test": [
-                "🧪 Test strategy: Use zen__testgen for comprehensive test suites",
-                "✅ Coverage matters: Aim for edge cases and error conditions",
-            ],
-            "implement": [
-                "📝 Plan first: Use zen__chat to strategize implementation approach",
-                "🏗️ Build incrementally: Start with core functionality, then extend",
-            ],
-        }
-
-        if intent in intent_reminders:
-            reminders.extend(intent_reminders[intent][:2])
-
-    def _add_scope_reminders(
-        self, context: dict[str, Any], reminders: list[str]
-    ) -> None:
-        """Add reminders based on task scope."""
-        scope = context.get("scope", "moderate")
+        for reminder in _INTENT_REMINDERS.get(intent, ())[:2]:
+            add(reminder)
 
+    @staticmethod
+    def _add_scope_reminders(scope: str, add: Callable[[str], None]) -> None:
+        """Add reminders based on task scope."""
         if scope == "extensive":
-            reminders.append(
+            add(
                 "🌍 Extensive operations: Delegate to Task subagents to save "
                 "context and enable parallel processing"
             )
         elif scope == "targeted":
-            reminders.append(
+            add(
                 "🎯 Targeted operations: Use Serena's symbolic navigation for "
                 "precise code manipulation"
             )
         else:  # moderate
-            reminders.append(
+            add(
                 "⚖️ Balanced approach: Consider batching related operations "
                 "for efficiency"
             )
 
-    def _add_urgency_reminders(
-        self, context: dict[str, Any], reminders: list[str]
-    ) -> None:
+    @staticmethod
+    def _add_urgency_reminders(urgency: str, add: Callable[[str], None]) -> None:
         """Add reminders based on urgency level."""
-        urgency = context.get("urgency", "normal")
-
         if urgency == "high":
-            reminders.append(
+            add(
                 "🚀 High urgency: Batch operations, use parallel execution, "
                 "delegate to specialized subagents"
             )
         elif urgency == "low":
-            reminders.append(
-                "🐌 Take time: Consider thorough analysis and comprehensive testing"
-            )
+            add("🐌 Take time: Consider thorough analysis and comprehensive testing")
 
-    def _add_pattern_reminders(
-        self, context: dict[str, Any], reminders: list[str]
-    ) -> None:
+    def _add_pattern_reminders(self, add: Callable[[str], None]) -> None:
         """Add reminders based on detected patterns."""
         if not self.context_analyzer or not self.context_analyzer.pattern_detector:
             return
@@ -176,45 +215,41 @@ class IntelligentReminder:
                     if hasattr(patterns[0], "type")
                     else "unknown"
                 )
-                reminders.append(
+                add(
                     f"📊 Pattern detected: {workflow_type} workflow - consider "
                     "optimizing this recurring pattern"
                 )
         except Exception as e:
-            print(f"Warning: Failed to add pattern reminders: {e}")
+            _log.warning("Failed to add pattern reminders: %s", e)
 
+    @staticmethod
     def _add_best_practice_reminders(
-        self, context: dict[str, Any], reminders: list[str]
+        keywords: Iterable[str], add: Callable[[str], None]
     ) -> None:
         """Add general best practice reminders."""
-        keywords = context.get("keywords", [])
-
         # File operation best practices
-        if any(keyword in ["file", "files", "read", "write"] for keyword in keywords):
-            reminders.append(
+        if not _FILE_KEYWORDS.isdisjoint(keywords):
+            add(
                 "📁 File operations: Prefer read_multiple_files for multiple files, "
                 "use absolute paths"
             )
 
         # Git operation best practices
-        if any(keyword in ["git", "commit", "branch", "merge"] for keyword in keywords):
-            reminders.append(
+        if not _GIT_KEYWORDS.isdisjoint(keywords):
+            add(
                 "🔄 Git operations: Use parallel git commands (status + diff + log) "
                 "for comprehensive context"
             )
 
         # Performance best practices
-        if any(
-            keyword in ["performance", "slow", "optimize", "speed"]
-            for keyword in keywords
-        ):
-            reminders.append(
+        if not _PERFORMANCE_KEYWORDS.isdisjoint(keywords):
+            add(
                 "⚡ Performance: Use modern tools (rg > grep, fd > find, bat > cat) "
                 "for 10-100x improvements"
             )
 
     def get_tool_specific_reminders(
-        self, tool_name: str, context: dict[str, Any]
+        self, tool_name: str, context: Mapping[str, Any]
     ) -> list[str]:
         """
         Get reminders specific to a particular tool being used.
@@ -226,41 +261,12 @@ class IntelligentReminder:
         Returns:
             List of tool-specific reminders
         """
-        reminders: list[str] = []
-
         try:
-            tool_reminders = {
-                "Read": [
-                    "📚 Consider read_multiple_files for multiple file operations",
-                    "🎯 Use find_symbol for specific code elements instead of "
-                    "reading entire files",
-                ],
-                "Bash": [
-                    "🔍 Use 'rg' instead of 'grep' for 10-100x performance improvement",
-                    "📂 Use 'fd' instead of 'find' for faster file discovery",
-                ],
-                "find_symbol": [
-                    "🗺️ Use get_symbols_overview first for broader context",
-                    "⚡ Batch multiple symbol searches for efficiency",
-                ],
-                "Write": [
-                    "✏️ Prefer editing existing files over creating new ones",
-                    "📝 Use absolute paths for consistency",
-                ],
-                "zen__chat": [
-                    "🧠 Enable use_websearch=true for current best practices",
-                    "🎯 Be specific about complexity level for optimal subagent "
-                    "allocation",
-                ],
-            }
-
-            if tool_name in tool_reminders:
-                reminders.extend(tool_reminders[tool_name])
-
-            return reminders[:2]  # Limit to 2 most relevant
+            # Limit to 2 most relevant
+            return list(_TOOL_REMINDERS.get(tool_name, ())[:2])
 
         except Exception as e:
-            print(f"Warning: Failed to generate tool-specific reminders: {e}")
+            _log.warning("Failed to generate tool-specific reminders: %s", e)
             return []
 
     def format_reminders_for_output(self, reminders: list[str]) -> str:
@@ -283,16 +289,16 @@ class IntelligentReminder:
             if len(unique_reminders) == 1:
                 return f"💡 Context tip: {unique_reminders[0]}"
             else:
-                formatted = "💡 Context-aware tips:\n"
-                for reminder in unique_reminders[:3]:  # Limit to top 3
-                    formatted += f"   • {reminder}\n"
-                return formatted.rstrip()
+                lines = ["💡 Context-aware tips:"]
+                # Limit to top 3
+                lines.extend(f"   • {reminder}" for reminder in unique_reminders[:3])
+                return "\n".join(lines)
 
         except Exception as e:
-            print(f"Warning: Failed to format reminders: {e}")
+            _log.warning("Failed to format reminders: %s", e)
             return ""
 
-    def should_show_reminders(self, context: dict[str, Any]) -> bool:
+    def should_show_reminders(self, context: Mapping[str, Any]) -> bool:
         """
         Determine if reminders should be shown based on context.
 
@@ -303,30 +309,8 @@ class IntelligentReminder:
             True if reminders should be displayed
         """
         try:
-            # Don't show reminders for trivial requests
-            if context.get("confidence", 0.0) < 0.3:
-                return False
-
-            # Always show for complex operations
-            if context.get("scope") == "extensive":
-                return True
-
-            # Show for high-urgency tasks
-            if context.get("urgency") == "high":
-                return True
-
-            # Show for specific intents that benefit from guidance
-            beneficial_intents = [
-                "debug",
-                "optimize",
-                "review",
-                "refactor",
-                "implement",
-            ]
-            if context.get("intent") in beneficial_intents:
-                return True
-
-            return True  # Default to showing reminders
+            # Reminders are shown unless the analysis has low confidence
+            return bool(context.get("confidence", 0.0) >= 0.3)
 
         except Exception:
             return True  # Default to showing reminders
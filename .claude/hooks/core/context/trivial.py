@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Trivial Prompt Detection
+
+Recognizes acknowledgements and simple arithmetic that skip context
+enhancement. Kept apart from the analyzer so hook entry points can answer
+this before paying for the analyzer's pattern compilation.
+"""
+
+import re
+
+# Acknowledgements that skip enhancement (an optional trailing "." is allowed)
+_TRIVIAL_REPLIES = frozenset(
+    {
+        "yes",
+        "no",
+        "ok",
+        "okay",
+        "sure",
+        "alright",
+        "fine",
+        "got it",
+        "understood",
+        "please do",
+        "do it",
+        "go ahead",
+        "proceed",
+        "continue",
+        "thanks",
+        "thank you",
+        "yep",
+        "yeah",
+        "nope",
+        "nah",
+        "cool",
+        "great",
+        "good",
+        "perfect",
+        "exactly",
+        "right",
+        "correct",
+        "indeed",
+        "absolutely",
+    }
+)
+
+# Simple arithmetic like "2 + 2?" or "what is 2 + 2?"
+_TRIVIAL_MATH_PATTERN = re.compile(r"^(?:what is )?\d+\s*[\+\-\*/]\s*\d+\s*\??$")
+
+
+def is_trivial_prompt(prompt: str) -> bool:
+    """
+    Check if a prompt is trivial and should skip enhancement.
+
+    Args:
+        prompt: User input to check
+
+    Returns:
+        True for empty or non-string input, acknowledgements and simple
+        arithmetic
+    """
+    if not prompt or not isinstance(prompt, str):
+        return True
+
+    prompt_lower = prompt.lower().strip()
+    if prompt_lower.removesuffix(".") in _TRIVIAL_REPLIES:
+        return True
+
+    # Only arithmetic remains; skip the regex unless the prefix can match
+    if not (prompt_lower[:1].isdigit() or prompt_lower.startswith("what is ")):
+        return False
+    return _TRIVIAL_MATH_PATTERN.match(prompt_lower) is not None
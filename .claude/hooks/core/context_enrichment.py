@@ -6,31 +6,121 @@ Clean executable entry point that uses the modular context system.
 Uses proper Python import handling and registry pattern for expandability.
 """
 
+import importlib
 import json
+import logging
+import os
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .context.analyzer import ContextAnalyzer
+    from .context.reminders import IntelligentReminder
+
+_log = logging.getLogger("claude_hooks.context")
+
+# orjson is an optional, faster parser for hook input (which can embed whole
+# file contents); its JSONDecodeError subclasses json.JSONDecodeError
+_loads: Callable[[bytes], Any]
+try:
+    _loads = importlib.import_module("orjson").loads
+except ImportError:
+    _loads = json.loads
+
+# Emitted after PreToolUse suggestions so they stay visible
+_SUPPRESS_OUTPUT_FALSE = json.dumps({"suppressOutput": False})
+
+# Shared instances, created on first use and reused across hook dispatches
+_analyzer: "ContextAnalyzer | None" = None
+_reminder: "IntelligentReminder | None" = None
+
+# Set once setup_python_path has run, so repeat calls skip the sys.path scan
+_path_configured = False
+
+# Static guidance placed between the context tips and the recommended tools
+_PROJECT_GUIDANCE = """PROJECT MANAGEMENT APPROACH:
+
+🧠 ZEN is your co-pilot project manager. Consult FIRST for:
+   • Task analysis & strategy (mcp__zen__chat with use_websearch=true)
+   • Hiring specialized workers: 0-3 subagents based on complexity
+   • Current best practices via Tavily web search
+
+🛠️ EXECUTION PRIORITIES:
+   1. Batch operations: Multiple files → read_multiple_files
+   2. Code navigation: Always Serena (find_symbol > Read)
+   3. Parallel execution: Never sequential when parallel possible
+
+📋 RESPONSE FORMAT:
+   • State subagent count (even if 0)
+   • End with 3 actionable next steps
+   • Skip docs unless explicitly requested
+
+🎯 RECOMMENDED TOOLS:
+"""
 
 
 def setup_python_path() -> None:
     """Setup Python path to enable proper imports."""
+    global _path_configured
+    if _path_configured:
+        return
+
     current_dir = Path(__file__).parent
     context_dir = current_dir / "context"
 
+    existing = set(sys.path)
     for path_dir in [str(current_dir), str(context_dir)]:
-        if path_dir not in sys.path:
+        if path_dir not in existing:
             sys.path.insert(0, path_dir)
 
+    _path_configured = True
+
+
+def _get_analyzer() -> "ContextAnalyzer":
+    """Return the shared ContextAnalyzer, creating it on first use."""
+    global _analyzer
+    if _analyzer is None:
+        from context.analyzer import ContextAnalyzer  # type: ignore[import-not-found]
+
+        _analyzer = ContextAnalyzer()
+    return _analyzer
+
+
+def _get_reminder() -> "IntelligentReminder":
+    """Return the shared IntelligentReminder, built on the shared analyzer."""
+    global _reminder
+    if _reminder is None:
+        from context.reminders import IntelligentReminder  # type: ignore[import-not-found]
+
+        _reminder = IntelligentReminder(_get_analyzer())
+    return _reminder
+
+
+def _exit_fast(code: int = 0) -> None:
+    """
+    Flush output and exit without interpreter teardown.
+
+    The hook owns no resources needing cleanup (state writes complete inside
+    their own ``with`` blocks and no atexit handlers are registered), so
+    skipping module teardown and final garbage collection is safe.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
 
 def main() -> None:
     """Hook entry point that coordinates modular context enrichment."""
+    logging.basicConfig(format="%(levelname)s: %(message)s", stream=sys.stderr)
     setup_python_path()
 
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read())
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
+        _log.error("Invalid JSON input: %s", e)
         sys.exit(1)
 
     hook_event = input_data.get("hook_event_name", "")
@@ -39,16 +129,16 @@ def main() -> None:
         result = handle_user_prompt_submit(input_data)
         if result["status"] == "success":
             print(result["enhanced_context"])
-        sys.exit(0)
+        _exit_fast()
 
     elif hook_event == "PreToolUse":
         result = handle_pre_tool_use(input_data)
         if result["status"] == "success":
             print(result["formatted_output"])
-            print(json.dumps({"suppressOutput": False}))
-        sys.exit(0)
+            print(_SUPPRESS_OUTPUT_FALSE)
+        _exit_fast()
 
-    sys.exit(0)
+    _exit_fast()
 
 
 def handle_user_prompt_submit(input_data: dict[str, Any]) -> dict[str, Any]:
@@ -59,81 +149,58 @@ def handle_user_prompt_submit(input_data: dict[str, Any]) -> dict[str, Any]:
         return {"status": "ignored", "reason": "Empty prompt"}
 
     try:
-        # Import context modules with error handling
+        # Load shared components with error handling
         try:
-            from context.analyzer import (
-                ContextAnalyzer,  # type: ignore[import-not-found]
-            )
-            from context.reminders import (
-                IntelligentReminder,  # type: ignore[import-not-found]
-            )
-            from context.tools import (
-                get_relevant_mcp_tools,  # type: ignore[import-not-found]
-            )
-        except ImportError as e:
-            print(f"Warning: Context modules not available: {e}", file=sys.stderr)
-            return {"status": "error", "reason": f"Import error: {e}"}
+            from context.trivial import is_trivial_prompt  # type: ignore[import-not-found]
 
-        # Initialize components
-        analyzer = ContextAnalyzer()
-        reminder_gen = IntelligentReminder()
+            # Check if this is a trivial request before loading the analyzer
+            if is_trivial_prompt(prompt):
+                return {"status": "ignored", "reason": "Trivial request"}
 
-        # Check if this is a trivial request
-        if analyzer.is_trivial_request(prompt):
-            return {"status": "ignored", "reason": "Trivial request"}
+            analyzer = _get_analyzer()
+            reminder_gen = _get_reminder()
+            from context.tools import get_relevant_mcp_tools  # type: ignore[import-not-found]
+        except ImportError as e:
+            _log.warning("Context modules not available: %s", e)
+            return {"status": "error", "reason": f"Import error: {e}"}
 
         # Analyze context
-        context = cast(dict[str, Any], analyzer.analyze_prompt_context(prompt))
-
-        # Generate intelligent reminders
-        reminders = reminder_gen.generate_reminders(prompt, context)
-
-        # Build context enhancements
-        output_parts = []
+        context = analyzer.analyze_prompt_context(prompt)
+
+        # Generate intelligent reminders, skipping the work when they
+        # would not be shown anyway
+        reminders = (
+            reminder_gen.generate_reminders(prompt, context)
+            if reminder_gen.should_show_reminders(context)
+            else []
+        )
 
         # Add context-aware enhancements
+        agent_suggestions = ""
         if context.get("suggested_agents"):
             agent_suggestions = "🤖 Suggested agents: " + ", ".join(
                 str(agent[0]) for agent in context["suggested_agents"][:2]
             )
-            output_parts.append(agent_suggestions)
 
         # Add reminders if relevant
-        if reminders and reminder_gen.should_show_reminders(context):
-            formatted_reminders = reminder_gen.format_reminders_for_output(reminders)
-            if formatted_reminders:
-                output_parts.append(formatted_reminders)
-
-        # Build enhanced context
-        if output_parts:
-            enhanced_context = "\n".join(output_parts)
-            context_tips = f"Think deeply: {enhanced_context}\n\n"
+        formatted_reminders = (
+            reminder_gen.format_reminders_for_output(reminders) if reminders else ""
+        )
+
+        # Build enhanced context; most prompts have neither part
+        if agent_suggestions and formatted_reminders:
+            enhanced_context = f"{agent_suggestions}\n{formatted_reminders}"
         else:
-            context_tips = ""
+            enhanced_context = agent_suggestions or formatted_reminders
+        context_tips = (
+            f"Think deeply: {enhanced_context}\n\n" if enhanced_context else ""
+        )
 
         # Get relevant MCP tools
         relevant_mcp_tools = get_relevant_mcp_tools(context)
 
         # Build comprehensive context
-        additional_context = f"""{context_tips}PROJECT MANAGEMENT APPROACH:
-
-🧠 ZEN is your co-pilot project manager. Consult FIRST for:
-   • Task analysis & strategy (mcp__zen__chat with use_websearch=true)
-   • Hiring specialized workers: 0-3 subagents based on complexity
-   • Current best practices via Tavily web search
-
-🛠️ EXECUTION PRIORITIES:
-   1. Batch operations: Multiple files → read_multiple_files
-   2. Code navigation: Always Serena (find_symbol > Read)
-   3. Parallel execution: Never sequential when parallel possible
-
-📋 RESPONSE FORMAT:
-   • State subagent count (even if 0)
-   • End with 3 actionable next steps
-   • Skip docs unless explicitly requested
-
-🎯 RECOMMENDED TOOLS:
-{relevant_mcp_tools}"""
+        additional_context = f"{context_tips}{_PROJECT_GUIDANCE}{relevant_mcp_tools}"
 
         return {
             "status": "success",
@@ -143,7 +210,7 @@ def handle_user_prompt_submit(input_data: dict[str, Any]) -> dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error in context enrichment: {e}", file=sys.stderr)
+        _log.error("Error in context enrichment: %s", e)
         return {"status": "error", "reason": str(e)}
 
 
@@ -156,17 +223,17 @@ def handle_pre_tool_use(input_data: dict[str, Any]) -> dict[str, Any]:
         return {"status": "ignored", "reason": "No tool name"}
 
     try:
-        # Import context modules with error handling
+        # Load shared analyzer with error handling
         try:
-            from context.analyzer import ContextAnalyzer
+            analyzer = _get_analyzer()
         except ImportError as e:
-            print(f"Warning: Context analyzer not available: {e}", file=sys.stderr)
+            _log.warning("Context analyzer not available: %s", e)
             return {"status": "error", "reason": f"Import error: {e}"}
 
-        # Initialize analyzer
-        analyzer = ContextAnalyzer()
-
-        # Track for pattern detection
+        # Track for pattern detection. This stays synchronous: the suggestions
+        # below count the operation being recorded here (e.g. the second Read
+        # in a row), and the hook process cannot exit before tracking finishes
+        # anyway, so deferring it would change results without saving latency.
         if analyzer.pattern_detector:
             analyzer.pattern_detector.add_operation(
                 tool_name, tool_input, input_data.get("timestamp", time.time())
@@ -194,7 +261,7 @@ def handle_pre_tool_use(input_data: dict[str, Any]) -> dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error in pre-tool use handler: {e}", file=sys.stderr)
+        _log.error("Error in pre-tool use handler: %s", e)
         return {"status": "error", "reason": str(e)}
 
 
@@ -204,11 +271,7 @@ def analyze_context(prompt: str) -> dict[str, Any]:
     setup_python_path()
 
     try:
-        from context.analyzer import ContextAnalyzer
-
-        analyzer = ContextAnalyzer()
-        result = analyzer.analyze_prompt_context(prompt)
-        return cast(dict[str, Any], result)
+        return _get_analyzer().analyze_prompt_context(prompt).as_dict()
     except Exception:
         return {
             "intent": "general",
@@ -226,11 +289,7 @@ def get_suggestions_for_tool(tool_name: str, tool_input: dict[str, Any]) -> list
     setup_python_path()
 
     try:
-        from context.analyzer import ContextAnalyzer  # type: ignore[import-not-found]
-
-        analyzer = ContextAnalyzer()
-        result = analyzer.get_contextual_suggestions(tool_name, tool_input)
-        return cast(list[str], result)
+        return _get_analyzer().get_contextual_suggestions(tool_name, tool_input)
     except Exception:
         return []
 
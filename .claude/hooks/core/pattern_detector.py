@@ -5,11 +5,65 @@ Detects complex patterns and workflows that could be optimized
 """
 
 import re
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
+# (trigger words, confirming pattern, agent, suggestion), checked in priority
+# order. A rule matches when the context contains a trigger word and, if it has
+# a pattern, the pattern also matches; patterns are only needed where word order
+# or adjacency matters.
+_AGENT_RULES: list[tuple[frozenset[str], re.Pattern[str] | None, str, str]] = [
+    (
+        frozenset({"debug", "error", "exception", "trace", "crash"}),
+        None,
+        "debugger",
+        "Use Task(subagent_type='debugger') for efficient debugging",
+    ),
+    (
+        frozenset({"review", "audit", "quality", "smell"}),
+        re.compile(r"\b(review|audit|quality|smell)\b.*\b(code|function|class)\b"),
+        "code-reviewer",
+        "Use Task(subagent_type='code-reviewer') for code quality analysis",
+    ),
+    (
+        frozenset({"security", "vulnerability", "injection", "auth"}),
+        None,
+        "security-auditor",
+        "Use Task(subagent_type='security-auditor') for security analysis",
+    ),
+    (
+        frozenset({"slow", "performance", "optimize", "profile"}),
+        None,
+        "performance-engineer",
+        "Use Task(subagent_type='performance-engineer') for performance issues",
+    ),
+    (
+        frozenset({"refactor", "modernize", "migrate", "legacy"}),
+        None,
+        "legacy-modernizer",
+        "Use Task(subagent_type='legacy-modernizer') for code modernization",
+    ),
+    (
+        frozenset({"test", "coverage", "unit", "integration"}),
+        None,
+        "test-automator",
+        "Use Task(subagent_type='test-automator') for test generation",
+    ),
+    (
+        frozenset({"find", "search", "locate"}),
+        re.compile(r"\b(find|search|locate)\s+(all|every|throughout)\b"),
+        "general-purpose",
+        "Use Task(subagent_type='general-purpose') for extensive searches",
+    ),
+]
+
+# Words as \b\w+\b sees them, for matching against the trigger sets
+_WORD_PATTERN = re.compile(r"\w+")
+
 
 class WorkflowType(Enum):
     """Common workflow patterns"""
@@ -43,95 +97,144 @@ class BatchableOperation:
     estimated_speedup: float  # Multiplier (e.g., 5.0 = 5x faster)
 
 
+@dataclass
+class _BufferScan:
+    """Snapshot of the operation buffer with the indices the detectors use"""
+
+    operations: list[tuple[str, dict[str, Any], float]]
+    read_indices: list[int] = field(default_factory=list)
+    search_indices: list[int] = field(default_factory=list)
+    git_indices: list[int] = field(default_factory=list)
+    log_read_indices: list[int] = field(default_factory=list)
+
+
 class PatternDetector:
     """Detects complex patterns in tool usage"""
 
     def __init__(self) -> None:
-        self.operation_buffer: list[tuple[str, dict[str, Any], float]] = []
         self.max_buffer_size = 50
+        # Bounded so appending evicts the oldest operation in O(1)
+        self.operation_buffer: deque[tuple[str, dict[str, Any], float]] = deque(
+            maxlen=self.max_buffer_size
+        )
+        # Bumped on every add; detect_workflows reuses its last result while
+        # the buffer is unchanged
+        self._buffer_version = 0
+        self._workflows_cache: tuple[int, list[WorkflowPattern]] | None = None
 
     def add_operation(
         self, tool_name: str, tool_input: dict[str, Any], timestamp: float
     ) -> None:
         """Add operation to buffer for pattern detection"""
         self.operation_buffer.append((tool_name, tool_input, timestamp))
-
-        # Keep buffer size manageable
-        if len(self.operation_buffer) > self.max_buffer_size:
-            self.operation_buffer.pop(0)
+        self._buffer_version += 1
 
     def detect_workflows(self) -> list[WorkflowPattern]:
         """Detect workflow patterns in recent operations"""
+        cached = self._workflows_cache
+        if cached is not None and cached[0] == self._buffer_version:
+            return list(cached[1])
+
         workflows = []
+        scan = self._scan_buffer()
 
         # Check for read-modify-write pattern
-        rmw = self._detect_read_modify_write()
+        rmw = self._detect_read_modify_write(scan)
         if rmw:
             workflows.append(rmw)
 
         # Check for search-read-edit pattern
-        sre = self._detect_search_read_edit()
+        sre = self._detect_search_read_edit(scan)
         if sre:
             workflows.append(sre)
 
         # Check for git workflow
-        git = self._detect_git_workflow()
+        git = self._detect_git_workflow(scan)
         if git:
             workflows.append(git)
 
         # Check for debugging workflow
-        debug = self._detect_debug_workflow()
+        debug = self._detect_debug_workflow(scan)
         if debug:
             workflows.append(debug)
 
-        return workflows
+        self._workflows_cache = (self._buffer_version, workflows)
+        return list(workflows)
+
+    def _scan_buffer(self) -> _BufferScan:
+        """Index the operations each workflow detector starts from, in one pass"""
+        scan = _BufferScan(list(self.operation_buffer))
+
+        for i, (tool_name, tool_input, _) in enumerate(scan.operations):
+            if tool_name == "Read":
+                scan.read_indices.append(i)
+                file_path = tool_input.get("file_path", "").lower()
+                if any(
+                    keyword in file_path
+                    for keyword in ["log", "error", "trace", "debug"]
+                ):
+                    scan.log_read_indices.append(i)
+            elif tool_name in ("search_for_pattern", "Grep", "find_symbol"):
+                scan.search_indices.append(i)
+            elif tool_name == "Bash" and "git" in tool_input.get("command", ""):
+                scan.git_indices.append(i)
+
+        return scan
 
     def detect_batchable_operations(self) -> list[BatchableOperation]:
         """Detect operations that could be batched"""
         batchable = []
 
-        # Group operations by tool
-        tool_groups = defaultdict(list)
-        for op in self.operation_buffer[-20:]:  # Look at last 20 operations
-            tool_name, tool_input, timestamp = op
-            tool_groups[tool_name].append((tool_input, timestamp))
+        # Collect the inputs of the only tools that can be batched
+        reads: list[dict[str, Any]] = []
+        symbol_searches: list[dict[str, Any]] = []
+        git_commands: list[dict[str, Any]] = []
+        # Look at last 20 operations
+        for tool_name, tool_input, _ in islice(
+            self.operation_buffer, max(0, len(self.operation_buffer) - 20), None
+        ):
+            if tool_name == "Read":
+                reads.append(tool_input)
+            elif tool_name == "find_symbol":
+                symbol_searches.append(tool_input)
+            elif tool_name == "Bash" and "git" in tool_input.get("command", ""):
+                git_commands.append(tool_input)
 
         # Check Read operations
-        if "Read" in tool_groups and len(tool_groups["Read"]) >= 2:
-            files = [op[0].get("file_path", "") for op in tool_groups["Read"]]
+        if len(reads) >= 2:
+            # Only the first few paths are shown
+            files = [read.get("file_path", "") for read in reads[:3]]
             batchable.append(
                 BatchableOperation(
                     tool_name="Read",
-                    operations=[op[0] for op in tool_groups["Read"]],
+                    operations=reads,
                     suggestion=(
-                        f"Batch read {len(files)} files with "
-                        f"read_multiple_files: {files[:3]}..."
+                        f"Batch read {len(reads)} files with "
+                        f"read_multiple_files: {files}..."
                     ),
-                    estimated_speedup=len(files)
+                    estimated_speedup=len(reads)
                     * 0.8,  # Not quite linear due to overhead
                 )
             )
 
         # Check find_symbol operations
-        if "find_symbol" in tool_groups and len(tool_groups["find_symbol"]) >= 2:
-            symbols = [op[0].get("name_path", "") for op in tool_groups["find_symbol"]]
+        if len(symbol_searches) >= 2:
+            count = len(symbol_searches)
             batchable.append(
                 BatchableOperation(
                     tool_name="find_symbol",
-                    operations=[op[0] for op in tool_groups["find_symbol"]],
-                    suggestion=f"Send {len(symbols)} find_symbol calls in parallel",
-                    estimated_speedup=len(symbols) * 0.9,
+                    operations=symbol_searches,
+                    suggestion=f"Send {count} find_symbol calls in parallel",
+                    estimated_speedup=count * 0.9,
                 )
             )
 
         # Check Bash operations
-        bash_ops = tool_groups.get("Bash", [])
-        git_commands = [op for op in bash_ops if "git" in op[0].get("command", "")]
         if len(git_commands) >= 2:
             batchable.append(
                 BatchableOperation(
                     tool_name="Bash",
-                    operations=[op[0] for op in git_commands],
+                    operations=git_commands,
                     suggestion="Run git commands in parallel instead of sequentially",
                     estimated_speedup=len(git_commands) * 0.95,
                 )
@@ -139,24 +242,23 @@ class PatternDetector:
 
         return batchable
 
-    def _detect_read_modify_write(self) -> WorkflowPattern | None:
+    def _detect_read_modify_write(self, scan: _BufferScan) -> WorkflowPattern | None:
         """Detect read → modify → write pattern"""
-        if len(self.operation_buffer) < 3:
+        operations = scan.operations
+        if len(operations) < 3:
             return None
 
-        # Look for pattern in last 10 operations
-        for i in range(
-            max(0, len(self.operation_buffer) - 10), len(self.operation_buffer) - 2
-        ):
-            op1, op2, op3 = self.operation_buffer[i : i + 3]
+        # Look for pattern in last 10 operations, starting from each Read
+        start = max(0, len(operations) - 10)
+        for i in scan.read_indices:
+            if i < start:
+                continue
+            if i > len(operations) - 3:
+                break
+            op1, op2, op3 = operations[i : i + 3]
 
             # Check if it's a read-modify-write sequence
-            if (
-                op1[0] == "Read"
-                and op3[0] == "Write"
-                and op1[1].get("file_path") == op3[1].get("file_path")
-            ):
-
+            if op3[0] == "Write" and op1[1].get("file_path") == op3[1].get("file_path"):
                 return WorkflowPattern(
                     type=WorkflowType.READ_MODIFY_WRITE,
                     steps=[op1, op2, op3],
@@ -170,18 +272,13 @@ class PatternDetector:
                 )
         return None
 
-    def _detect_search_read_edit(self) -> WorkflowPattern | None:
+    def _detect_search_read_edit(self, scan: _BufferScan) -> WorkflowPattern | None:
         """Detect search → read → edit pattern"""
         # Look for search followed by reads
-        search_indices = [
-            i
-            for i, op in enumerate(self.operation_buffer)
-            if op[0] in ("search_for_pattern", "Grep", "find_symbol")
-        ]
-
-        for idx in search_indices:
-            if idx + 2 < len(self.operation_buffer):
-                following_ops = self.operation_buffer[idx : idx + 5]
+        operations = scan.operations
+        for idx in scan.search_indices:
+            if idx + 2 < len(operations):
+                following_ops = operations[idx : idx + 5]
                 read_ops = [op for op in following_ops if op[0] == "Read"]
 
                 if len(read_ops) >= 2:
@@ -197,22 +294,18 @@ class PatternDetector:
                     )
         return None
 
-    def _detect_git_workflow(self) -> WorkflowPattern | None:
+    def _detect_git_workflow(self, scan: _BufferScan) -> WorkflowPattern | None:
         """Detect git status → diff → commit pattern"""
-        git_ops = [
-            (i, op)
-            for i, op in enumerate(self.operation_buffer)
-            if op[0] == "Bash" and "git" in op[1].get("command", "")
-        ]
+        git_indices = scan.git_indices
 
-        if len(git_ops) >= 2:
+        if len(git_indices) >= 2:
             # Check if they're sequential
-            for i in range(len(git_ops) - 1):
-                if git_ops[i + 1][0] - git_ops[i][0] == 1:  # Sequential indices
+            for i in range(len(git_indices) - 1):
+                if git_indices[i + 1] - git_indices[i] == 1:  # Sequential indices
                     return WorkflowPattern(
                         type=WorkflowType.STATUS_DIFF_COMMIT,
-                        steps=[op[1] for op in git_ops],
-                        timestamp=git_ops[-1][1][2],
+                        steps=[scan.operations[idx] for idx in git_indices],
+                        timestamp=scan.operations[git_indices[-1]][2],
                         optimization_suggestion=(
                             "Run all git commands in parallel! Send git status, "
                             "git diff, and git log in a single message with multiple "
@@ -221,24 +314,12 @@ class PatternDetector:
                     )
         return None
 
-    def _detect_debug_workflow(self) -> WorkflowPattern | None:
+    def _detect_debug_workflow(self, scan: _BufferScan) -> WorkflowPattern | None:
         """Detect debugging workflow pattern"""
         # Look for error/log reading followed by code searches
-        log_reads = [
-            (i, op)
-            for i, op in enumerate(self.operation_buffer)
-            if (
-                op[0] == "Read"
-                and any(
-                    keyword in op[1].get("file_path", "").lower()
-                    for keyword in ["log", "error", "trace", "debug"]
-                )
-            )
-        ]
-
-        for idx, _ in log_reads:
+        for idx in scan.log_read_indices:
             # Check following operations for code searches
-            following = self.operation_buffer[idx : idx + 5]
+            following = scan.operations[idx : idx + 5]
             if any(op[0] in ("find_symbol", "search_for_pattern") for op in following):
                 return WorkflowPattern(
                     type=WorkflowType.DEBUG_TRACE_FIX,
@@ -284,51 +365,17 @@ class SmartSuggestions:
             return "🚀 These operations can run in parallel - send them in one message!"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def suggest_task_agent(context: str) -> tuple[str, str] | None:
-        """Suggest appropriate task agent based on context"""
+        """Suggest appropriate task agent based on context (cached per context)"""
         context_lower = context.lower()
 
-        # Mapping of keywords to agents
-        agent_map = [
-            (
-                r"\b(debug|error|exception|trace|crash)\b",
-                "debugger",
-                "Use Task(subagent_type='debugger') for efficient debugging",
-            ),
-            (
-                r"\b(review|audit|quality|smell)\b.*\b(code|function|class)\b",
-                "code-reviewer",
-                "Use Task(subagent_type='code-reviewer') for code quality analysis",
-            ),
-            (
-                r"\b(security|vulnerability|injection|auth)\b",
-                "security-auditor",
-                "Use Task(subagent_type='security-auditor') for security analysis",
-            ),
-            (
-                r"\b(slow|performance|optimize|profile)\b",
-                "performance-engineer",
-                "Use Task(subagent_type='performance-engineer') for performance issues",
-            ),
-            (
-                r"\b(refactor|modernize|migrate|legacy)\b",
-                "legacy-modernizer",
-                "Use Task(subagent_type='legacy-modernizer') for code modernization",
-            ),
-            (
-                r"\b(test|coverage|unit|integration)\b",
-                "test-automator",
-                "Use Task(subagent_type='test-automator') for test generation",
-            ),
-            (
-                r"\b(find|search|locate)\s+(all|every|throughout)\b",
-                "general-purpose",
-                "Use Task(subagent_type='general-purpose') for extensive searches",
-            ),
-        ]
-
-        for pattern, agent, suggestion in agent_map:
-            if re.search(pattern, context_lower):
+        words = set(_WORD_PATTERN.findall(context_lower))
+
+        for triggers, pattern, agent, suggestion in _AGENT_RULES:
+            if triggers.isdisjoint(words):
+                continue
+            if pattern is None or pattern.search(context_lower):
                 return agent, suggestion
 
         return None
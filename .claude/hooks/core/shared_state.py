@@ -5,12 +5,34 @@ Provides inter-hook communication and state persistence
 """
 
 import fcntl
+import importlib
 import json
 import os
 import time
 from collections import defaultdict
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+# orjson is an optional, faster codec for the state file; its JSONDecodeError
+# subclasses json.JSONDecodeError and both sides read and write UTF-8 bytes
+_loads: Callable[[bytes], Any]
+_dumps: Callable[[Any], bytes]
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+else:
+    _loads = _orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        # Stringify non-str keys the way json does
+        data: bytes = _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+        return data
 
 
 class HookStateManager:
@@ -19,13 +41,21 @@ class HookStateManager:
     STATE_FILE = "/tmp/claude_hook_shared_state.json"
     LOCK_FILE = "/tmp/claude_hook_state.lock"
 
+    # (state file, lock file) pairs already ensured in this process
+    _ensured_files: ClassVar[set[tuple[str, str]]] = set()
+
     def __init__(self) -> None:
         self.state_file = Path(self.STATE_FILE)
         self.lock_file = Path(self.LOCK_FILE)
         self._ensure_files_exist()
 
     def _ensure_files_exist(self) -> None:
-        """Ensure state files exist"""
+        """Ensure state files exist, checking once per process"""
+        key = (self.STATE_FILE, self.LOCK_FILE)
+        if key in self._ensured_files:
+            return
+        self._ensured_files.add(key)
+
         if not self.state_file.exists():
             self.state_file.write_text("{}")
         if not self.lock_file.exists():
@@ -33,15 +63,23 @@ class HookStateManager:
 
     def _acquire_lock(self, timeout: float = 1.0) -> int | None:
         """Acquire file lock for thread-safe operations"""
-        lock_fd = os.open(str(self.lock_file), os.O_RDWR)
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
+        # O_CREAT recreates a lock file removed after the once-per-process check
+        lock_fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT, 0o666)
+        deadline = time.monotonic() + timeout
+
+        # Locks are held for well under a millisecond, so retry quickly at
+        # first and back off towards 10ms only under sustained contention
+        delay = 0.0005
+        while True:
             try:
                 fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
                 return lock_fd
             except BlockingIOError:
-                time.sleep(0.01)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.01)
 
         os.close(lock_fd)
         return None
@@ -51,6 +89,22 @@ class HookStateManager:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         os.close(lock_fd)
 
+    def _load(self) -> dict[str, Any]:
+        """Read state from disk; caller must hold the lock"""
+        try:
+            with open(self.state_file, "rb") as f:
+                state: dict[str, Any] = _loads(f.read())
+                return state
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+    def _dump(self, state: dict[str, Any]) -> None:
+        """Write state to disk; caller must hold the lock"""
+        # Serialize compactly in one call (json.dump and any indent fall back
+        # to json's pure-Python encoder) so the file lands in a single write
+        with open(self.state_file, "wb") as f:
+            f.write(_dumps(state))
+
     def read_state(self) -> dict[str, Any]:
         """Read current state with locking"""
         lock_fd = self._acquire_lock()
@@ -58,11 +112,7 @@ class HookStateManager:
             return {}
 
         try:
-            with open(self.state_file) as f:
-                state: dict[str, Any] = json.load(f)
-                return state
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
-            return {}
+            return self._load()
         finally:
             self._release_lock(lock_fd)
 
@@ -73,34 +123,31 @@ class HookStateManager:
             return
 
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
+            self._dump(state)
         finally:
             self._release_lock(lock_fd)
 
-    def update_state(self, updates: dict[str, Any]) -> None:
-        """Update specific fields in state"""
+    def modify_state(self, mutate: Callable[[dict[str, Any]], None]) -> None:
+        """Apply an in-place change to state under a single lock"""
         lock_fd = self._acquire_lock()
         if lock_fd is None:
             return
 
         try:
-            # Read current state
-            try:
-                with open(self.state_file) as f:
-                    state = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError, OSError):
-                state = {}
+            state = self._load()
+            mutate(state)
+            self._dump(state)
+        finally:
+            self._release_lock(lock_fd)
 
-            # Apply updates
+    def update_state(self, updates: dict[str, Any]) -> None:
+        """Update specific fields in state"""
+
+        def apply(state: dict[str, Any]) -> None:
             state.update(updates)
             state["last_updated"] = time.time()
 
-            # Write back
-            with open(self.state_file, "w") as f:
-                json.dump(state, f, indent=2)
-        finally:
-            self._release_lock(lock_fd)
+        self.modify_state(apply)
 
 
 class SessionTracker:
@@ -116,14 +163,6 @@ class SessionTracker:
         execution_time: float | None = None,
     ) -> None:
         """Track tool execution"""
-        state = self.state_manager.read_state()
-
-        # Initialize structures
-        if "tool_executions" not in state:
-            state["tool_executions"] = []
-        if "tool_metrics" not in state:
-            state["tool_metrics"] = {}
-
         # Add execution record
         execution = {
             "tool": tool_name,
@@ -137,27 +176,26 @@ class SessionTracker:
         elif tool_name == "Bash" and "command" in tool_input:
             execution["command"] = tool_input["command"]
 
-        state["tool_executions"].append(execution)
-
-        # Keep only last 100 executions
-        if len(state["tool_executions"]) > 100:
-            state["tool_executions"] = state["tool_executions"][-100:]
+        def record(state: dict[str, Any]) -> None:
+            executions = state.setdefault("tool_executions", [])
+            executions.append(execution)
 
-        # Update metrics
-        if tool_name not in state["tool_metrics"]:
-            state["tool_metrics"][tool_name] = {
-                "count": 0,
-                "total_time": 0,
-                "avg_time": 0,
-            }
+            # Keep only last 100 executions
+            if len(executions) > 100:
+                del executions[:-100]
 
-        metrics = state["tool_metrics"][tool_name]
-        metrics["count"] += 1
-        if execution_time:
-            metrics["total_time"] += execution_time
-            metrics["avg_time"] = metrics["total_time"] / metrics["count"]
+            # Update metrics
+            metrics = state.setdefault("tool_metrics", {}).setdefault(
+                tool_name, {"count": 0, "total_time": 0, "avg_time": 0}
+            )
+            metrics["count"] += 1
+            if execution_time:
+                metrics["total_time"] += execution_time
+                metrics["avg_time"] = metrics["total_time"] / metrics["count"]
 
-        self.state_manager.write_state(state)
+        # Read, update and write back under one lock so concurrent hooks
+        # cannot drop each other's executions
+        self.state_manager.modify_state(record)
 
     def get_recent_operations(
         self, tool_name: str | None = None, seconds: int = 30
@@ -176,6 +214,22 @@ class SessionTracker:
 
         return recent
 
+    def iter_recent_operations(self, seconds: int = 30) -> Iterator[dict[str, Any]]:
+        """
+        Yield operations within time window, newest first.
+
+        Executions are appended in time order, so the walk stops at the first
+        one outside the window instead of filtering the whole history, and
+        callers that only need the last few matches can stop early.
+        """
+        executions = self.state_manager.read_state().get("tool_executions", [])
+
+        cutoff = time.time() - seconds
+        for ex in reversed(executions):
+            if ex["timestamp"] <= cutoff:
+                return
+            yield ex
+
     def detect_patterns(self) -> dict[str, list[str]]:
         """Detect common patterns that could be optimized"""
         patterns = defaultdict(list)
@@ -216,26 +270,17 @@ class PerformanceMonitor:
 
     def record_validation_time(self, hook_name: str, duration: float) -> None:
         """Record hook validation time"""
-        state = self.state_manager.read_state()
-
-        if "hook_performance" not in state:
-            state["hook_performance"] = {}
-
-        if hook_name not in state["hook_performance"]:
-            state["hook_performance"][hook_name] = {
-                "count": 0,
-                "total_time": 0,
-                "avg_time": 0,
-                "max_time": 0,
-            }
 
-        perf = state["hook_performance"][hook_name]
-        perf["count"] += 1
-        perf["total_time"] += duration
-        perf["avg_time"] = perf["total_time"] / perf["count"]
-        perf["max_time"] = max(perf["max_time"], duration)
+        def record(state: dict[str, Any]) -> None:
+            perf = state.setdefault("hook_performance", {}).setdefault(
+                hook_name, {"count": 0, "total_time": 0, "avg_time": 0, "max_time": 0}
+            )
+            perf["count"] += 1
+            perf["total_time"] += duration
+            perf["avg_time"] = perf["total_time"] / perf["count"]
+            perf["max_time"] = max(perf["max_time"], duration)
 
-        self.state_manager.write_state(state)
+        self.state_manager.modify_state(record)
 
     def get_slow_operations(self, threshold_ms: float = 100) -> list[dict[str, Any]]:
         """Get operations that exceeded time threshold"""
@@ -255,17 +300,27 @@ class PerformanceMonitor:
         return slow_ops
 
 
+# Shared tracker for the convenience functions, created on first use
+_tracker: SessionTracker | None = None
+
+
+def _get_tracker() -> SessionTracker:
+    """Return the shared SessionTracker, creating it on first use."""
+    global _tracker
+    if _tracker is None:
+        _tracker = SessionTracker()
+    return _tracker
+
+
 # Convenience functions for hooks
 def track_tool_use(tool_name: str, tool_input: dict[str, Any]) -> None:
     """Quick function to track tool usage"""
-    tracker = SessionTracker()
-    tracker.add_tool_execution(tool_name, tool_input)
+    _get_tracker().add_tool_execution(tool_name, tool_input)
 
 
 def get_optimization_suggestions() -> list[str]:
     """Get current optimization suggestions based on patterns"""
-    tracker = SessionTracker()
-    patterns = tracker.detect_patterns()
+    patterns = _get_tracker().detect_patterns()
 
     suggestions = []
     for _, pattern_messages in patterns.items():
@@ -276,7 +331,7 @@ def get_optimization_suggestions() -> list[str]:
 
 def cleanup_old_state(max_age_seconds: int = 3600) -> None:
     """Clean up old state data"""
-    state_manager = HookStateManager()
+    state_manager = _get_tracker().state_manager
     state = state_manager.read_state()
 
     current_time = time.time()
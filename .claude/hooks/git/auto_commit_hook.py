@@ -4,8 +4,8 @@
 import os
 import subprocess
 import sys
+from collections import Counter
 from datetime import datetime
-from pathlib import Path
 
 
 def run_git_command(cmd: list[str], cwd: str | None = None) -> tuple[int, str, str]:
@@ -19,10 +19,57 @@ def run_git_command(cmd: list[str], cwd: str | None = None) -> tuple[int, str, s
         return 1, "", str(e)
 
 
+def _run_git_status(repo_path: str) -> tuple[int, bytes, str]:
+    """Run porcelain git status; return exit code, raw stdout, and stderr."""
+    # -z gives NUL-terminated, unquoted paths; stdout is kept as bytes because
+    # stripping or decoding it as text would mangle the leading status column
+    # and unusual filenames.
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=repo_path,
+            capture_output=True,
+            check=False,
+        )
+    except Exception as e:
+        return 1, b"", str(e)
+    return result.returncode, result.stdout, os.fsdecode(result.stderr).strip()
+
+
+def _parse_git_status(output: bytes) -> tuple[list[str], list[str], int]:
+    """
+    Split porcelain -z status output into staged and unstaged paths.
+
+    Also returns the number of distinct changed paths: porcelain lists each
+    path once, even when it is both staged and unstaged.
+    """
+    staged = []
+    unstaged = []
+    path_count = 0
+
+    records = iter(output.split(b"\0"))
+    for record in records:
+        if record:
+            index_status = record[0:1]
+            worktree_status = record[1:2]
+            filepath = os.fsdecode(record[3:])
+            path_count += 1
+
+            # Renames and copies are followed by their original path
+            if index_status in (b"R", b"C") or worktree_status in (b"R", b"C"):
+                next(records, None)
+
+            if index_status not in (b" ", b"?"):  # Staged
+                staged.append(filepath)
+            if worktree_status != b" ":  # Unstaged or untracked
+                unstaged.append(filepath)
+
+    return staged, unstaged, path_count
+
+
 def get_git_status(repo_path: str) -> tuple[bool, list[str], list[str]]:
     """Check if there are changes to commit."""
-    # Check for uncommitted changes
-    returncode, stdout, _ = run_git_command(["git", "status", "--porcelain"], repo_path)
+    returncode, stdout, _ = _run_git_status(repo_path)
 
     if returncode != 0:
         return False, [], []
@@ -30,35 +77,31 @@ def get_git_status(repo_path: str) -> tuple[bool, list[str], list[str]]:
     if not stdout:
         return False, [], []
 
-    # Parse the status output
-    staged = []
-    unstaged = []
+    staged, unstaged, _ = _parse_git_status(stdout)
+    return True, staged, unstaged
 
-    for line in stdout.split("\n"):
-        if line:
-            status = line[:2]
-            filepath = line[3:]
 
-            if status[0] != " " and status[0] != "?":  # Staged
-                staged.append(filepath)
-            if status[1] != " ":  # Unstaged or untracked
-                unstaged.append(filepath)
+def _file_suffix(filepath: str) -> str:
+    """Return the lowercased suffix of a git path, as Path(filepath).suffix would."""
+    name = filepath.rstrip("/").rpartition("/")[2]
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
 
-    return True, staged, unstaged
 
+def create_commit_message(
+    staged: list[str], unstaged: list[str], distinct_count: int | None = None
+) -> str:
+    """
+    Generate a descriptive commit message based on changes.
 
-def create_commit_message(staged: list[str], unstaged: list[str]) -> str:
-    """Generate a descriptive commit message based on changes."""
+    ``distinct_count`` is the number of distinct changed files when already
+    known; otherwise it is computed from ``staged`` and ``unstaged``.
+    """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     # Count file types
-    file_types: dict[str, int] = {}
     all_files = staged + unstaged
-
-    for file in all_files:
-        ext = Path(file).suffix.lower()
-        if ext:
-            file_types[ext] = file_types.get(ext, 0) + 1
+    file_types = Counter(filter(None, map(_file_suffix, all_files)))
 
     # Build commit message
     message_parts = [f"Auto-commit: Session ended at {timestamp}"]
@@ -69,7 +112,9 @@ def create_commit_message(staged: list[str], unstaged: list[str]) -> str:
             type_summary.append(f"{count} {ext} file{'s' if count > 1 else ''}")
         message_parts.append(f"\nModified: {', '.join(type_summary)}")
 
-    message_parts.append(f"\nTotal files changed: {len(set(all_files))}")
+    if distinct_count is None:
+        distinct_count = len(set(all_files))
+    message_parts.append(f"\nTotal files changed: {distinct_count}")
 
     return "\n".join(message_parts)
 
@@ -79,19 +124,22 @@ def auto_commit(repo_path: str | None = None) -> bool:
     if repo_path is None:
         repo_path = os.getcwd()
 
-    # Check if we're in a git repository
-    returncode, _, _ = run_git_command(["git", "rev-parse", "--git-dir"], repo_path)
+    # Check for changes; git status also fails outside a repository, so no
+    # separate rev-parse is needed
+    returncode, status_output, stderr = _run_git_status(repo_path)
     if returncode != 0:
-        print("❌ Not in a git repository")
+        if "not a git repository" in stderr:
+            print("❌ Not in a git repository")
+        else:
+            print(f"❌ Failed to read git status: {stderr}")
         return False
 
-    # Check for changes
-    has_changes, staged, unstaged = get_git_status(repo_path)
-
-    if not has_changes:
+    if not status_output:
         print("✅ No changes to commit")
         return True
 
+    staged, unstaged, distinct_count = _parse_git_status(status_output)
+
     # Stage all changes
     if unstaged:
         print(f"📝 Staging {len(unstaged)} file(s)...")
@@ -101,7 +149,7 @@ def auto_commit(repo_path: str | None = None) -> bool:
             return False
 
     # Create commit
-    commit_message = create_commit_message(staged, unstaged)
+    commit_message = create_commit_message(staged, unstaged, distinct_count)
     print("💾 Creating commit...")
 
     returncode, stdout, stderr = run_git_command(
@@ -112,16 +160,10 @@ def auto_commit(repo_path: str | None = None) -> bool:
         print(f"❌ Failed to commit: {stderr}")
         return False
 
+    # git commit's own output starts with the "[branch sha] subject" line
     print("✅ Successfully committed changes")
     print(f"   {stdout}")
 
-    # Optional: Show what was committed
-    returncode, stdout, _ = run_git_command(
-        ["git", "log", "-1", "--oneline"], repo_path
-    )
-    if returncode == 0:
-        print(f"   Latest commit: {stdout}")
-
     return True
 
 
@@ -9,6 +9,7 @@ Handles automatic memory storage, retrieval, and management for context-aware AI
 - subagent_stop_hook.py: Memory management for subagent interactions
 - precompact_hook.py: Memory optimization before compaction
 - pretool_hook.py: Pre-tool memory preparation
+- _hook_bootstrap.py: Shared memory_manager import used by the hooks above
 
 These are executable hook scripts, not importable modules.
 """
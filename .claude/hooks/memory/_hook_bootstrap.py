@@ -0,0 +1,103 @@
+"""
+Shared bootstrap for the memory hooks.
+
+Puts the memory system on sys.path and imports memory_manager through the
+regular import system, so its compiled bytecode is reused from __pycache__ and
+repeat imports are a sys.modules lookup.
+"""
+
+import importlib
+import json
+import marshal
+import os
+import sys
+from collections.abc import Callable
+from typing import Any
+
+# orjson is an optional, faster parser for hook input; its JSONDecodeError
+# subclasses json.JSONDecodeError
+json_loads: Callable[[bytes], Any]
+try:
+    json_loads = importlib.import_module("orjson").loads
+except ImportError:
+    json_loads = json.loads
+
+# Resolved get_memory_manager, set on the first import_memory_manager() call
+_get_memory_manager: Callable[..., Any] | None = None
+
+
+def get_memory_system_path() -> str:
+    """Get the memory system path robustly"""
+    try:
+        # Try using __file__ first; this file lives in .claude/hooks/memory
+        claude_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        return os.path.join(claude_dir, "memory_system")
+    except NameError:
+        # Fallback for contexts where __file__ is not defined
+        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
+        return os.path.join(project_dir, ".claude", "memory_system")
+
+
+def _unavailable_memory_manager(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for get_memory_manager when the memory system cannot load"""
+    return None
+
+
+def import_memory_manager() -> Callable[..., Any]:
+    """Import memory manager with fallback handling"""
+    global _get_memory_manager
+    if _get_memory_manager is None:
+        memory_system_path = get_memory_system_path()
+        if memory_system_path not in sys.path:
+            sys.path.insert(0, memory_system_path)
+
+        try:
+            module = importlib.import_module("memory_manager")
+            _get_memory_manager = module.get_memory_manager
+        except (ImportError, AttributeError):
+            # Graceful degradation: hooks treat a None manager as disabled
+            _get_memory_manager = _unavailable_memory_manager
+
+    return _get_memory_manager
+
+
+def load_memory_config(project_path: str) -> dict[str, Any] | None:
+    """
+    Load the project's memory system config, or None when it does not exist.
+
+    The parsed config is cached as marshal data in the memory system's db
+    directory, keyed by the file's path, mtime and size, so hooks only parse
+    the JSON after it changes.
+    """
+    config_path = os.path.join(project_path, ".claude/memory_system/config.json")
+    cache_dir = os.path.join(project_path, ".claude/memory_system/db")
+    cache_file = os.path.join(cache_dir, "config.marshal")
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+
+    key = (config_path, stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cached_config = marshal.load(f)
+        if cached_key == key:
+            return cached_config  # type: ignore[no-any-return]
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(config_path, "rb") as f:
+        config: dict[str, Any] = json_loads(f.read())
+
+    # Write through a temporary file so concurrent hooks never read a
+    # partial cache entry
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}"
+        with open(tmp_file, "wb") as f:
+            marshal.dump((key, config), f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError):
+        pass
+
+    return config
@@ -3,62 +3,33 @@
 PreCompact Hook for Claude Code Memory System
 Preserves important memories before context compaction
 """
-import json
+import heapq
 import os
 import sys
-from pathlib import Path
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
-# Add memory system to path
-memory_system_path = str(Path(__file__).parent.parent.parent / "memory_system")
-if memory_system_path not in sys.path:
-    sys.path.insert(0, memory_system_path)
-
-
-# Import memory manager with robust error handling
-def import_memory_manager():
-    """Import memory manager with fallback handling"""
-    try:
-        # Try using __file__ first
-        memory_system_path = str(Path(__file__).parent.parent.parent / "memory_system")
-    except NameError:
-        # Fallback for contexts where __file__ is not defined
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-        memory_system_path = str(Path(project_dir) / ".claude" / "memory_system")
-
-    try:
-        # Add path and import
-        if memory_system_path not in sys.path:
-            sys.path.insert(0, memory_system_path)
-
-        # Import the module dynamically
-        import importlib.util
-
-        memory_manager_file = Path(memory_system_path) / "memory_manager.py"
-
-        spec = importlib.util.spec_from_file_location(
-            "memory_manager", memory_manager_file
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError("Could not load memory_manager module")
-
-        memory_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(memory_manager_module)
-
-        return memory_manager_module.get_memory_manager
-
-    except (ImportError, FileNotFoundError, AttributeError):
-        # Return stub function for graceful degradation
-        def get_memory_manager(*args, **kwargs):
-            return None
-
-        return get_memory_manager
-
+from _hook_bootstrap import (  # type: ignore[import-not-found]
+    import_memory_manager,
+    json_loads,
+    load_memory_config,
+)
 
 # Import the function
 get_memory_manager = import_memory_manager()
 
+# Base importance per memory type; other types score 0.3
+_TYPE_SCORES = {
+    "error_solution": 0.8,
+    "security_finding": 0.9,
+    "architectural_decision": 0.9,
+    "performance_insight": 0.7,
+    "code_pattern": 0.6,
+    "subagent_summary": 0.7,
+    "session_summary": 0.5,
+}
+
 
 class MemoryPreserver:
     """Preserves important memories before compaction"""
@@ -72,33 +43,29 @@ class MemoryPreserver:
         """Identify memories that should be preserved"""
         important_memories = []
 
-        # Get recent memories
-        all_memories = self.memory_manager.list_memories(limit=500)
-
-        # Filter by time window (hours)
-        cutoff_time = datetime.now() - timedelta(hours=time_window)
+        # Get recent memories within the time window (hours)
+        now = datetime.now()
+        cutoff_time = now - timedelta(hours=time_window)
+        all_memories = self.memory_manager.list_memories(limit=500, since=cutoff_time)
 
         for memory in all_memories:
             memory_time = datetime.fromisoformat(memory["timestamp"])
 
-            # Skip if too old
-            if memory_time < cutoff_time:
-                continue
-
-            # Calculate importance score
-            importance = self._calculate_importance(memory)
+            # Calculate importance score, reusing the parsed timestamp
+            hours_old = (now - memory_time).total_seconds() / 3600
+            importance = self._calculate_importance(memory, hours_old)
 
             if importance > 0.5:  # Threshold for preservation
                 memory["importance_score"] = importance
                 important_memories.append(memory)
 
-        # Sort by importance
-        important_memories.sort(key=lambda m: m["importance_score"], reverse=True)
-
-        return important_memories[:50]  # Keep top 50
+        # Keep the top 50 by importance (same order as a stable reverse sort)
+        return heapq.nlargest(
+            50, important_memories, key=lambda m: m["importance_score"]
+        )
 
-    def _calculate_importance(self, memory: Dict[str, Any]) -> float:
-        """Calculate importance score for a memory"""
+    def _calculate_importance(self, memory: Dict[str, Any], hours_old: float) -> float:
+        """Calculate importance score for a memory that is hours_old hours old"""
         score = 0.0
 
         memory_type = memory.get("memory_type", "")
@@ -106,17 +73,7 @@ class MemoryPreserver:
         content_length = len(memory.get("content", ""))
 
         # Type-based scoring
-        type_scores = {
-            "error_solution": 0.8,
-            "security_finding": 0.9,
-            "architectural_decision": 0.9,
-            "performance_insight": 0.7,
-            "code_pattern": 0.6,
-            "subagent_summary": 0.7,
-            "session_summary": 0.5,
-        }
-
-        score += type_scores.get(memory_type, 0.3)
+        score += _TYPE_SCORES.get(memory_type, 0.3)
 
         # Access-based scoring
         if access_count > 5:
@@ -131,9 +88,6 @@ class MemoryPreserver:
             score += 0.1
 
         # Recency bonus
-        memory_time = datetime.fromisoformat(memory["timestamp"])
-        hours_old = (datetime.now() - memory_time).total_seconds() / 3600
-
         if hours_old < 1:
             score += 0.2
         elif hours_old < 6:
@@ -143,37 +97,36 @@ class MemoryPreserver:
 
     def create_preservation_summary(self, memories: List[Dict[str, Any]]) -> str:
         """Create a summary of preserved memories"""
-        summary = "Pre-Compaction Memory Preservation\n"
-        summary += "=" * 50 + "\n"
-        summary += f"Preserved {len(memories)} important memories\n\n"
+        parts = [
+            "Pre-Compaction Memory Preservation\n",
+            "=" * 50 + "\n",
+            f"Preserved {len(memories)} important memories\n\n",
+        ]
 
         # Group by type
-        by_type = {}
+        by_type: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
         for memory in memories:
-            memory_type = memory.get("memory_type", "general")
-            if memory_type not in by_type:
-                by_type[memory_type] = []
-            by_type[memory_type].append(memory)
+            by_type[memory.get("memory_type", "general")].append(memory)
 
         # Summarize each type
         for memory_type, type_memories in by_type.items():
-            summary += (
+            parts.append(
                 f"\n{memory_type.replace('_', ' ').title()} ({len(type_memories)}):\n"
             )
 
             for memory in type_memories[:5]:  # Top 5 per type
                 content_preview = memory["content"][:100].replace("\n", " ")
                 score = memory.get("importance_score", 0)
-                summary += f"  • [{score:.2f}] {content_preview}...\n"
+                parts.append(f"  • [{score:.2f}] {content_preview}...\n")
 
-        return summary
+        return "".join(parts)
 
 
 def main():
     """Main hook entry point for PreCompact events"""
     try:
         # Read hook input
-        input_data = json.load(sys.stdin)
+        input_data = json_loads(sys.stdin.buffer.read())
 
         # PreCompact specific fields
         context_size = input_data.get("context_size", 0)
@@ -184,13 +137,10 @@ def main():
         project_path = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
         # Load configuration
-        config_path = Path(project_path) / ".claude/memory_system/config.json"
-        if not config_path.exists():
+        config = load_memory_config(project_path)
+        if config is None:
             sys.exit(0)
 
-        with open(config_path) as f:
-            config = json.load(f)
-
         if not config.get("memory_system", {}).get("enabled", False):
             sys.exit(0)
 
@@ -3,55 +3,31 @@
 PreToolUse Hook for Claude Code Memory System
 Provides memory-guided suggestions for tool usage
 """
-import json
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, Optional
 
+from _hook_bootstrap import (  # type: ignore[import-not-found]
+    import_memory_manager,
+    json_loads,
+    load_memory_config,
+)
 
-# Import memory manager with robust error handling
-def import_memory_manager():
-    """Import memory manager with fallback handling"""
-    try:
-        # Try using __file__ first
-        memory_system_path = str(Path(__file__).parent.parent.parent / "memory_system")
-    except NameError:
-        # Fallback for contexts where __file__ is not defined
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-        memory_system_path = str(Path(project_dir) / ".claude" / "memory_system")
-
-    try:
-        # Add path and import
-        if memory_system_path not in sys.path:
-            sys.path.insert(0, memory_system_path)
-
-        # Import the module dynamically
-        import importlib.util
-
-        memory_manager_file = Path(memory_system_path) / "memory_manager.py"
-
-        spec = importlib.util.spec_from_file_location(
-            "memory_manager", memory_manager_file
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError("Could not load memory_manager module")
-
-        memory_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(memory_manager_module)
 
-        return memory_manager_module.get_memory_manager
+# Import the function
+get_memory_manager = import_memory_manager()
 
-    except (ImportError, FileNotFoundError, AttributeError):
-        # Return stub function for graceful degradation
-        def get_memory_manager(*args, **kwargs):
-            return None
+# Tools that main() provides suggestions for
+_RELEVANT_TOOLS = frozenset(
+    ["find_symbol", "Bash", "Edit", "Write", "search_for_pattern"]
+)
 
-        return get_memory_manager
+# JSON-quoted names of the relevant tools, for the raw-input prefilter
+_RELEVANT_TOOL_NAMES = tuple(f'"{name}"'.encode() for name in _RELEVANT_TOOLS)
 
-
-# Import the function
-get_memory_manager = import_memory_manager()
+# (query, memory_types, limit) arguments for one memory search
+SearchSpec = tuple[str, list[str], int]
 
 
 class ToolSuggestionEngine:
@@ -61,37 +37,61 @@ class ToolSuggestionEngine:
         self.memory_manager = memory_manager
 
     def get_tool_suggestions(
-        self, tool_name: str, tool_input: Dict[str, Any]
+        self, tool_name: str, tool_input: dict[str, Any]
     ) -> Optional[str]:
         """Get suggestions based on past tool usage"""
-        suggestions = []
-
         if tool_name == "find_symbol":
-            suggestions.extend(self._suggest_for_find_symbol(tool_input))
+            searches = self._searches_for_find_symbol(tool_input)
+            suggest = self._suggest_for_find_symbol
         elif tool_name == "Bash":
-            suggestions.extend(self._suggest_for_bash(tool_input))
+            searches = self._searches_for_bash(tool_input)
+            suggest = self._suggest_for_bash
         elif tool_name == "Edit" or tool_name == "Write":
-            suggestions.extend(self._suggest_for_edit(tool_input))
+            searches = self._searches_for_edit(tool_input)
+            suggest = self._suggest_for_edit
         elif tool_name == "search_for_pattern":
-            suggestions.extend(self._suggest_for_search(tool_input))
+            searches = self._searches_for_search(tool_input)
+            suggest = self._suggest_for_search
+        else:
+            return None
 
+        # Run every search the tool needs in a single batched call
+        results: dict[str, list[dict[str, Any]]] = {}
+        if searches:
+            names = list(searches)
+            batch = self.memory_manager.search_memories_batch(
+                [searches[name] for name in names]
+            )
+            results = dict(zip(names, batch, strict=True))
+
+        suggestions = suggest(tool_input, results)
         if suggestions:
             return self._format_suggestions(suggestions)
         return None
 
-    def _suggest_for_find_symbol(self, tool_input: Dict[str, Any]) -> List[str]:
-        """Suggestions for find_symbol tool"""
-        suggestions = []
+    def _searches_for_find_symbol(
+        self, tool_input: dict[str, Any]
+    ) -> dict[str, SearchSpec]:
+        """Memory searches for find_symbol tool"""
         name_path = tool_input.get("name_path", "")
 
         # Search for similar symbol searches
-        memories = self.memory_manager.search_memories(
-            query=f"find_symbol {name_path}",
-            memory_types=["project_context", "code_pattern"],
-            limit=3,
-        )
+        return {
+            "symbols": (
+                f"find_symbol {name_path}",
+                ["project_context", "code_pattern"],
+                3,
+            )
+        }
 
-        for memory in memories:
+    def _suggest_for_find_symbol(
+        self, tool_input: dict[str, Any], results: dict[str, list[dict[str, Any]]]
+    ) -> list[str]:
+        """Suggestions for find_symbol tool"""
+        suggestions = []
+        name_path = tool_input.get("name_path", "")
+
+        for memory in results["symbols"]:
             metadata = memory.get("metadata", {})
             if metadata.get("tool") == "find_symbol" and metadata.get("success"):
                 pattern = metadata.get("pattern", "")
@@ -102,76 +102,88 @@ class ToolSuggestionEngine:
 
         return suggestions
 
-    def _suggest_for_bash(self, tool_input: Dict[str, Any]) -> List[str]:
-        """Suggestions for Bash commands"""
-        suggestions = []
+    def _searches_for_bash(self, tool_input: dict[str, Any]) -> dict[str, SearchSpec]:
+        """Memory searches for Bash commands"""
+        searches: dict[str, SearchSpec] = {}
         command = tool_input.get("command", "")
 
         # Check for common error patterns
         if "npm" in command or "yarn" in command:
             # Search for package.json scripts
-            memories = self.memory_manager.search_memories(
-                query="package.json scripts", memory_types=["project_context"], limit=2
-            )
-
-            for memory in memories:
-                if "scripts" in memory.get("content", ""):
-                    suggestions.append("Check package.json for available scripts")
+            searches["scripts"] = ("package.json scripts", ["project_context"], 2)
 
         # Search for similar commands that failed
-        if any(cmd in command for cmd in ["test", "build", "lint"]):
-            memories = self.memory_manager.search_memories(
-                query=f"{command} error", memory_types=["error_solution"], limit=2
-            )
+        if "test" in command or "build" in command or "lint" in command:
+            searches["errors"] = (f"{command} error", ["error_solution"], 2)
+
+        return searches
+
+    def _suggest_for_bash(
+        self, tool_input: dict[str, Any], results: dict[str, list[dict[str, Any]]]
+    ) -> list[str]:
+        """Suggestions for Bash commands"""
+        suggestions = []
 
-            for memory in memories:
-                content = memory.get("content", "")[:100]
-                suggestions.append(f"Previous issue: {content}...")
+        for memory in results.get("scripts", []):
+            if "scripts" in memory.get("content", ""):
+                suggestions.append("Check package.json for available scripts")
+
+        for memory in results.get("errors", []):
+            content = memory.get("content", "")[:100]
+            suggestions.append(f"Previous issue: {content}...")
 
         return suggestions
 
-    def _suggest_for_edit(self, tool_input: Dict[str, Any]) -> List[str]:
-        """Suggestions for Edit/Write operations"""
-        suggestions = []
+    def _searches_for_edit(self, tool_input: dict[str, Any]) -> dict[str, SearchSpec]:
+        """Memory searches for Edit/Write operations"""
         file_path = tool_input.get("file_path", "")
 
         # Search for code patterns in similar files
-        if file_path:
-            file_ext = Path(file_path).suffix
-            memories = self.memory_manager.search_memories(
-                query=f"code pattern {file_ext}", memory_types=["code_pattern"], limit=2
-            )
+        if not file_path:
+            return {}
 
-            for memory in memories:
-                metadata = memory.get("metadata", {})
-                pattern_type = metadata.get("pattern_type", "")
-                if pattern_type:
-                    suggestions.append(
-                        f"Common pattern: {pattern_type} implementations exist"
-                    )
+        file_ext = Path(file_path).suffix
+        return {"patterns": (f"code pattern {file_ext}", ["code_pattern"], 2)}
+
+    def _suggest_for_edit(
+        self, tool_input: dict[str, Any], results: dict[str, list[dict[str, Any]]]
+    ) -> list[str]:
+        """Suggestions for Edit/Write operations"""
+        suggestions = []
+
+        for memory in results.get("patterns", []):
+            metadata = memory.get("metadata", {})
+            pattern_type = metadata.get("pattern_type", "")
+            if pattern_type:
+                suggestions.append(
+                    f"Common pattern: {pattern_type} implementations exist"
+                )
 
         return suggestions
 
-    def _suggest_for_search(self, tool_input: Dict[str, Any]) -> List[str]:
-        """Suggestions for search operations"""
-        suggestions = []
+    def _searches_for_search(self, tool_input: dict[str, Any]) -> dict[str, SearchSpec]:
+        """Memory searches for search operations"""
         pattern = tool_input.get("substring_pattern", "") or tool_input.get(
             "pattern", ""
         )
 
         # Look for previous successful searches
-        memories = self.memory_manager.search_memories(
-            query=f"search {pattern}", memory_types=["project_context"], limit=2
-        )
+        return {"searches": (f"search {pattern}", ["project_context"], 2)}
 
-        for memory in memories:
+    def _suggest_for_search(
+        self, tool_input: dict[str, Any], results: dict[str, list[dict[str, Any]]]
+    ) -> list[str]:
+        """Suggestions for search operations"""
+        suggestions = []
+
+        for memory in results["searches"]:
             metadata = memory.get("metadata", {})
             if metadata.get("success") and "file" in metadata:
                 suggestions.append(f"Previously found in: {metadata['file']}")
 
         return suggestions
 
-    def _format_suggestions(self, suggestions: List[str]) -> Optional[str]:
+    def _format_suggestions(self, suggestions: list[str]) -> Optional[str]:
         """Format suggestions for output"""
         if not suggestions:
             return None
@@ -187,28 +199,31 @@ def main():
     """Main hook entry point for PreToolUse events"""
     try:
         # Read hook input
-        input_data = json.load(sys.stdin)
+        raw = sys.stdin.buffer.read()
+
+        # tool_name is a JSON string, so a relevant tool's quoted name must
+        # appear verbatim (barring \u escapes); skip parsing when none does
+        if b"\\u" not in raw and not any(name in raw for name in _RELEVANT_TOOL_NAMES):
+            sys.exit(0)
+
+        input_data = json_loads(raw)
 
         # PreToolUse specific fields
         tool_name = input_data.get("tool_name", "")
         tool_input = input_data.get("tool_input", {})
 
         # Skip if not a relevant tool
-        relevant_tools = ["find_symbol", "Bash", "Edit", "Write", "search_for_pattern"]
-        if tool_name not in relevant_tools:
+        if tool_name not in _RELEVANT_TOOLS:
             sys.exit(0)
 
         # Get project path
         project_path = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
         # Load configuration
-        config_path = Path(project_path) / ".claude/memory_system/config.json"
-        if not config_path.exists():
+        config = load_memory_config(project_path)
+        if config is None:
             sys.exit(0)
 
-        with open(config_path) as f:
-            config = json.load(f)
-
         if not config.get("memory_system", {}).get("enabled", False):
             sys.exit(0)
 
@@ -3,53 +3,16 @@
 Memory Retrieval Hook for Claude Code
 Provides context-aware suggestions based on stored memories
 """
-import json
 import os
 import re
 import sys
-from pathlib import Path
 from typing import Any
 
-
-# Import memory manager with robust error handling
-def import_memory_manager() -> Any:
-    """Import memory manager with fallback handling"""
-    try:
-        # Try using __file__ first
-        memory_system_path = str(Path(__file__).parent.parent.parent / "memory_system")
-    except NameError:
-        # Fallback for contexts where __file__ is not defined
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-        memory_system_path = str(Path(project_dir) / ".claude" / "memory_system")
-
-    try:
-        # Add path and import
-        if memory_system_path not in sys.path:
-            sys.path.insert(0, memory_system_path)
-
-        # Import the module dynamically
-        import importlib.util
-
-        memory_manager_file = Path(memory_system_path) / "memory_manager.py"
-
-        spec = importlib.util.spec_from_file_location(
-            "memory_manager", memory_manager_file
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError("Could not load memory_manager module")
-
-        memory_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(memory_manager_module)
-
-        return memory_manager_module.get_memory_manager
-
-    except (ImportError, FileNotFoundError, AttributeError):
-        # Return stub function for graceful degradation
-        def get_memory_manager(*args: Any, **kwargs: Any) -> Any | None:
-            return None
-
-        return get_memory_manager
-
+from _hook_bootstrap import (  # type: ignore[import-not-found]
+    import_memory_manager,
+    json_loads,
+    load_memory_config,
+)
 
 # Import the function
 get_memory_manager = import_memory_manager()
@@ -218,7 +181,7 @@ def main() -> None:
 
     try:
         # Read hook input
-        input_data = json.load(sys.stdin)
+        input_data = json_loads(sys.stdin.buffer.read())
 
         # Check if this is a UserPromptSubmit event
         hook_event = input_data.get("hook_event_name", "")
@@ -233,15 +196,12 @@ def main() -> None:
         project_path = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
         # Load configuration
-        config_path = Path(project_path) / ".claude/memory_system/config.json"
-        if not config_path.exists():
+        config = load_memory_config(project_path)
+        if config is None:
             # No memory system config, output just a space
             print(" ")
             sys.exit(0)
 
-        with open(config_path) as f:
-            config = json.load(f)
-
         if not config.get("memory_system", {}).get("enabled", False):
             # Memory system disabled, output just a space
             print(" ")
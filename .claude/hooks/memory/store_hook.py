@@ -3,70 +3,20 @@
 Memory Storage Hook for Claude Code
 Automatically stores relevant code patterns, solutions, and insights
 """
-import json
 import os
 import sys
 import re
-from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from _hook_bootstrap import (  # type: ignore[import-not-found]
+    import_memory_manager,
+    json_loads,
+    load_memory_config,
+)
 
-# Add memory system to path - robust approach
-def get_memory_system_path():
-    """Get the memory system path robustly"""
-    try:
-        # Try using __file__ first
-        return str(Path(__file__).parent.parent.parent / "memory_system")
-    except NameError:
-        # Fallback for contexts where __file__ is not defined
-        # Get from CLAUDE_PROJECT_DIR or current working directory
-        project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
-        return str(Path(project_dir) / ".claude" / "memory_system")
-
-
-# Import memory manager with proper error handling
-def import_memory_manager():
-    """Import memory manager with fallback handling"""
-    memory_system_path = get_memory_system_path()
-
-    try:
-        # Add path and import
-        if memory_system_path not in sys.path:
-            sys.path.insert(0, memory_system_path)
-
-        # Import the module dynamically
-        import importlib.util
-
-        memory_manager_file = Path(memory_system_path) / "memory_manager.py"
-
-        spec = importlib.util.spec_from_file_location(
-            "memory_manager", memory_manager_file
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError("Could not load memory_manager module")
 
-        memory_manager_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(memory_manager_module)
-
-        return (
-            memory_manager_module.get_memory_manager,
-            memory_manager_module.MemoryConfig,
-        )
-
-    except (ImportError, FileNotFoundError, AttributeError):
-        # Return stub functions for graceful degradation
-        def get_memory_manager(*args, **kwargs):
-            return None
-
-        class MemoryConfig:
-            def __init__(self, *args, **kwargs):
-                pass
-
-        return get_memory_manager, MemoryConfig
-
-
-# Import the functions
-get_memory_manager, MemoryConfig = import_memory_manager()
+# Import the function
+get_memory_manager = import_memory_manager()
 
 
 class MemoryExtractor:
@@ -236,7 +186,7 @@ def main():
     """Main hook entry point"""
     try:
         # Read hook input
-        input_data = json.load(sys.stdin)
+        input_data = json_loads(sys.stdin.buffer.read())
 
         # Check if this is a relevant event
         hook_event = input_data.get("hook_event_name", "")
@@ -256,13 +206,10 @@ def main():
         project_path = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
         # Load configuration
-        config_path = Path(project_path) / ".claude/memory_system/config.json"
-        if not config_path.exists():
+        config = load_memory_config(project_path)
+        if config is None:
             return
 
-        with open(config_path) as f:
-            config = json.load(f)
-
         if not config.get("memory_system", {}).get("enabled", False):
             return
 
@@ -15,6 +15,9 @@ import chromadb
 from chromadb.config import Settings
 from pydantic import BaseModel, Field
 
+# (query, memory_types, limit) arguments for one search_memories call
+SearchSpec = tuple[str, list[str] | None, int | None]
+
 
 @dataclass
 class MemoryConfig:
@@ -114,6 +117,13 @@ class MemoryManager:
         """
         )
 
+        self.db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_project_timestamp
+            ON memories(project_id, timestamp)
+        """
+        )
+
         self.db.commit()
 
     def _init_chroma(self):
@@ -189,39 +199,67 @@ class MemoryManager:
         limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Search memories using vector similarity"""
-        limit = limit or self.config.max_results
+        return self.search_memories_batch([(query, memory_types, limit)])[0]
 
-        # Build where clause for filtering
-        where: Dict[str, Any] = {"project_id": self.config.project_id}
-        if memory_types:
-            where["memory_type"] = {"$in": memory_types}
+    def search_memories_batch(
+        self, searches: list[SearchSpec]
+    ) -> list[list[dict[str, Any]]]:
+        """Run several (query, memory_types, limit) searches in one pass
 
-        # Search in ChromaDB
-        results = self.collection.query(
-            query_texts=[query], n_results=limit, where=where
-        )
+        Searches sharing memory_types and limit go to ChromaDB as a single
+        multi-text query, and access stats for every hit are committed once.
+        Results are returned in the same order as the searches.
+        """
+        # Group search indexes by their ChromaDB filter and result count
+        groups: dict[tuple[tuple[str, ...], int], list[int]] = {}
+        for index, (_, memory_types, limit) in enumerate(searches):
+            key = (tuple(memory_types or ()), limit or self.config.max_results)
+            groups.setdefault(key, []).append(index)
+
+        batch_results: list[list[dict[str, Any]]] = [[] for _ in searches]
+        accessed_ids: list[str] = []
+
+        for (group_types, group_limit), indexes in groups.items():
+            # Build where clause for filtering
+            where: dict[str, Any] = {"project_id": self.config.project_id}
+            if group_types:
+                where["memory_type"] = {"$in": list(group_types)}
+
+            # Search in ChromaDB
+            results = self.collection.query(
+                query_texts=[searches[index][0] for index in indexes],
+                n_results=group_limit,
+                where=where,
+            )
 
-        if not results["ids"] or not results["ids"][0]:
-            return []
+            for row, index in enumerate(indexes):
+                if not results["ids"] or not results["ids"][row]:
+                    continue
+
+                accessed_ids.extend(results["ids"][row])
+                batch_results[index] = self._format_search_row(results, row)
 
         # Update access stats
-        memory_ids = results["ids"][0]
-        self._update_access_stats(memory_ids)
+        if accessed_ids:
+            self._update_access_stats(accessed_ids)
 
-        # Format results
-        memories = []
+        return batch_results
+
+    def _format_search_row(self, results: Any, row: int) -> list[dict[str, Any]]:
+        """Format one query's ChromaDB results, dropping weak matches"""
+        memories: list[dict[str, Any]] = []
         # Ensure we have all required result fields
         if results["distances"] and results["documents"] and results["metadatas"]:
-            for i, memory_id in enumerate(memory_ids):
-                if results["distances"][0][i] > self.config.similarity_threshold:
+            for i, memory_id in enumerate(results["ids"][row]):
+                if results["distances"][row][i] > self.config.similarity_threshold:
                     continue
 
                 memories.append(
                     {
                         "id": memory_id,
-                        "content": results["documents"][0][i],
-                        "metadata": results["metadatas"][0][i],
-                        "similarity": 1 - results["distances"][0][i],
+                        "content": results["documents"][row][i],
+                        "metadata": results["metadatas"][row][i],
+                        "similarity": 1 - results["distances"][row][i],
                     }
                 )
 
@@ -247,9 +285,15 @@ class MemoryManager:
         }
 
     def list_memories(
-        self, memory_type: Optional[str] = None, limit: int = 50
+        self,
+        memory_type: Optional[str] = None,
+        limit: int = 50,
+        since: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
-        """List memories with optional filtering"""
+        """List memories with optional filtering, newest first
+
+        With since, only memories stored at or after that time are returned.
+        """
         query = """
             SELECT * FROM memories
             WHERE project_id = ?
@@ -260,6 +304,11 @@ class MemoryManager:
             query += " AND memory_type = ?"
             params.append(memory_type)
 
+        if since is not None:
+            # Bound as a datetime so it is formatted like the stored values
+            query += " AND timestamp >= ?"
+            params.append(since)
+
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
 